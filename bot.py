@@ -11,6 +11,10 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from fancards.database import Player, run_migrations
+from fancards.enums.patreon import patreon_tier_cache
+from fancards.factory import Assets, CharacterNameLayouts, CardIdAllocator, CardRenderer, DiskRenderCache, DropPool, ImageEncoder
+
 
 OWNER_ID = 353774678826811403
 
@@ -35,6 +39,10 @@ class Fancards(commands.Bot):
         self.log = logging.getLogger("discord")
         self.log.setLevel(logging.INFO)
 
+        self.renderer = self.create_renderer()
+        self.card_id_allocator = CardIdAllocator(block_size=config.getint("card_id", "block_size", fallback=256))
+        self.drop_pool = self.create_drop_pool()
+
         super().__init__(
             command_prefix=command_prefix,
             owner_id=OWNER_ID,
@@ -45,15 +53,29 @@ class Fancards(commands.Bot):
         )
 
     async def setup_hook(self) -> None:
+        Assets.load()
+        CharacterNameLayouts.load()
+        self.log.info("Card assets have been loaded.")
+
+        self.pool = await self.create_pool()
+        await run_migrations(self.pool)
+        await self.card_id_allocator.open(self.pool)
+        self.drop_pool.start()
+
         cogs = [p.stem for p in Path(".").glob("./src/cogs/*.py")]
         for cog in cogs:
             await self.load_extension(f"src.cogs.{cog}")
             self.log.info(f"Extension '{cog}' has been loaded.")
 
         self.add_command(sync)
+        self.add_command(repair_card_counts)
 
         await self.load_extension("jishaku")
-        self.pool = await self.create_pool()
+
+    async def close(self) -> None:
+        await super().close()
+        self.drop_pool.stop()
+        self.renderer.close()
 
     async def on_connect(self) -> None:
         self.log.info(f"Connected to Client (version: {discord.__version__}).")
@@ -63,16 +85,53 @@ class Fancards(commands.Bot):
         self.log.info(f"Bot has connected (Guilds: {len(self.guilds)}) (Bot Username: {self.user}) (Bot ID: {self.user.id}).")
         runtime = discord.utils.utcnow() - self.uptime
         self.log.info(f"Connected after {runtime.total_seconds():.2f} seconds.")
+        patreon_tier_cache.clear()  # role updates are missed while disconnected
 
     async def on_disconnect(self) -> None:
         self.log.critical("Bot has disconnected!")
 
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if before.roles != after.roles:
+            patreon_tier_cache.invalidate(after)
+
+    async def on_member_remove(self, member: discord.Member) -> None:
+        patreon_tier_cache.invalidate(member)
+
     async def init_connection(self, connection: asyncpg.Connection[asyncpg.Record]) -> None:
         with open("fancards/database/schema.sql", "r") as file:
             query = file.read()
 
         await connection.execute(query)
 
+    def create_renderer(self) -> CardRenderer:
+        executor = config.get("renderer", "executor", fallback="thread")
+        max_workers = config.getint("renderer", "max_workers", fallback=4)
+        queue_size = config.getint("renderer", "queue_size", fallback=32)
+        assert executor in ("thread", "process")
+
+        disk_cache = None
+        if config.getboolean("render_cache", "enabled", fallback=False):
+            disk_cache = DiskRenderCache(
+                directory=config.get("render_cache", "directory"),
+                max_bytes=config.getint("render_cache", "max_mb") * 1024 * 1024
+            )
+
+        return CardRenderer(
+            executor=executor,
+            max_workers=max_workers,
+            queue_size=queue_size,
+            disk_cache=disk_cache
+        )
+
+    def create_drop_pool(self) -> DropPool:
+        return DropPool(
+            self.renderer,
+            size=config.getint("drop_pool", "size", fallback=4),
+            max_bytes=config.getint("drop_pool", "max_mb", fallback=16) * 1024 * 1024,
+            cpu_budget=config.getfloat("drop_pool", "cpu_budget", fallback=0.25),
+            encoder=ImageEncoder[config.get("drop_pool", "encoder", fallback="WEBP")]
+        )
+
     async def create_pool(self) -> asyncpg.Pool[asyncpg.Record]:
         dev_mode = config.getboolean("mode", "dev")
         postgres_password = config.get("database", "postgres_pwd")
@@ -118,6 +177,14 @@ async def sync(ctx: Context, option: Optional[Literal["~", "*", "^"]] = None) ->
     await ctx.send(f"Synced {len(synced)} commands {'globally' if option is None else 'to the current guild'}.")
 
 
+@commands.is_owner()
+@commands.command(name="repair-card-counts")
+async def repair_card_counts(ctx: Context) -> None:
+    """Recounts the cards of every player, grabs and burns wait until it is done"""
+    repaired = await Player.repair_card_counts(ctx.bot.pool)
+    await ctx.send(f"Repaired the card count of {repaired} players.")
+
+
 def main() -> None:
     dev_mode = config.getboolean("mode", "dev")
     token_discord_api = config.get("token", "discord_api")
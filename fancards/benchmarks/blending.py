@@ -0,0 +1,70 @@
+"""Compares the numpy and Pillow texture blending of every :class:`CardCondition`.
+
+Every kernel is checked against the Pillow output before it is timed.
+Run from the repository root::
+
+    python -m fancards.benchmarks.blending
+"""
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+import statistics
+from typing import Callable
+
+from PIL import Image, ImageChops
+
+from fancards.enums import CardRarity, CardCondition, Character
+from fancards.factory import CardFactory
+from fancards.factory.blending import HAS_NUMPY, blend_texture_numpy, blend_texture_pil
+
+
+BlendFunction = Callable[[Image.Image, CardCondition, bool], Image.Image]
+
+
+def _time_blend(blend: BlendFunction, image: Image.Image, condition: CardCondition, shiny: bool, repeat: int) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        blend(image, condition, shiny)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings) * 1000
+
+
+def _max_difference(image: Image.Image, expected: Image.Image) -> int:
+    """Returns the largest difference of any channel of any pixel."""
+    difference = ImageChops.difference(image, expected)
+    return max(high for _, high in difference.getextrema())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50, help="how many times each texture is blended")
+    parser.add_argument("--tolerance", type=int, default=1, help="the largest accepted difference per channel")
+    args = parser.parse_args()
+
+    if not HAS_NUMPY:
+        sys.exit("numpy is not installed.")
+
+    character = Character.get_character_data("Monster Match Knight")
+    image = CardFactory.add_card_id(CardFactory.get_base_image(CardRarity.EPIC, character), "ABC123")
+    for condition in CardCondition:  # warm up numpy and every texture layer before anything is timed
+        blend_texture_numpy(image, condition, True)
+
+    print(f"{'condition':<10} {'shiny':<6} {'pillow ms':>10} {'numpy ms':>9} {'speedup':>8} {'max diff':>9}")
+    for condition in CardCondition:
+        for shiny in (False, True):
+            expected = blend_texture_pil(image, condition, shiny)
+            difference = _max_difference(blend_texture_numpy(image, condition, shiny), expected)
+            if difference > args.tolerance:
+                sys.exit(f"{condition.name} (shiny={shiny}) differs by {difference}, more than {args.tolerance}.")
+
+            pillow = _time_blend(blend_texture_pil, image, condition, shiny, args.repeat)
+            numpy = _time_blend(blend_texture_numpy, image, condition, shiny, args.repeat)
+            print(f"{condition.name:<10} {str(shiny):<6} {pillow:>10.2f} {numpy:>9.2f} {pillow / numpy:>7.2f}x {difference:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Checks that the maintained card counts stay exact under concurrent grabs and burns, and times them.
+
+Registers ``--players`` throwaway players with negative Discord user IDs, which Discord never
+hands out, and lets ``--workers`` tasks per player add and delete their cards at the same time.
+Afterwards every ``user_data.user.card_count`` has to match the actual amount of cards and
+:meth:`Player.repair_card_counts` must have nothing to fix. The players and their cards are deleted at the end.
+
+The repository has no database test fixture, so this check runs by hand against a scratch
+database. It applies ``schema.sql`` and the migrations itself, like the bot does on startup,
+and exits with status 1 if any count is off::
+
+    python -m fancards.benchmarks.card_count --dsn postgresql://postgres@localhost/fancards
+"""
+from __future__ import annotations
+
+import sys
+import time
+import random
+import asyncio
+import argparse
+import datetime
+
+import asyncpg
+
+from fancards.database import Player, CardTable, run_migrations
+from fancards.enums import CardRarity, CardCondition
+from fancards.factory import CardIdAllocator
+
+
+async def _grab_and_burn(player: Player, fk_user_id: int, operations: int, allocator: CardIdAllocator, rng: random.Random) -> None:
+    owned: list[str] = []
+    for _ in range(operations):
+        if owned and rng.random() < 0.4:
+            card_ids = [owned.pop(rng.randrange(len(owned))) for _ in range(min(rng.randint(1, 3), len(owned)))]
+            if len(card_ids) == 1:
+                await player.collection.delete_card(card_ids[0])
+            else:
+                await player.collection.delete_cards_by_card_id(card_ids)
+        else:
+            card_id, = await allocator.allocate()
+            await player.collection.add_card(
+                CardTable(
+                    card_id=card_id,
+                    fk_user_id=fk_user_id,
+                    rarity=CardRarity.COMMON,
+                    condition=CardCondition.GOOD,
+                    character_name="Troll",
+                    created_at=datetime.datetime.now(datetime.timezone.utc)
+                )
+            )
+            owned.append(card_id)
+
+
+async def _check(dsn: str, players: int, workers: int, operations: int, seed: int) -> bool:
+    pool = await asyncpg.create_pool(dsn=dsn, min_size=workers, max_size=workers * 2)
+    assert pool
+    rng = random.Random(seed)
+    allocator = CardIdAllocator()
+    discord_user_ids = [-(index + 1) for index in range(players)]
+    try:
+        with open("fancards/database/schema.sql", "r") as file:
+            await pool.execute(file.read())
+
+        await run_migrations(pool)
+        await allocator.open(pool)
+        contexts = [await Player(pool, discord_user_id).get_context() for discord_user_id in discord_user_ids]
+
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            _grab_and_burn(context.player, context.fk_user_id, operations, allocator, random.Random(rng.random()))
+            for context in contexts for _ in range(workers)
+        ])
+        elapsed = time.perf_counter() - start
+        total_operations = players * workers * operations
+        print(f"{total_operations:,} grabs and burns in {elapsed:.2f}s ({total_operations / elapsed:,.0f}/s)")
+
+        query = """
+        SELECT player.discord_user_id, player.card_count, COUNT(card.card_id) AS actual_count
+        FROM user_data.user AS player
+        LEFT JOIN user_data.card AS card ON card.fk_user_id = player.id
+        WHERE player.discord_user_id = ANY($1::BIGINT[])
+        GROUP BY player.id;
+        """
+        async with pool.acquire() as connection:
+            results = await connection.fetch(query, discord_user_ids)
+
+        exact = True
+        for result in results:
+            card_count = await Player(pool, result["discord_user_id"]).card_count()
+            if not result["card_count"] == card_count == result["actual_count"]:
+                exact = False
+                print(f"player {result['discord_user_id']}: counted {card_count}, owns {result['actual_count']}")
+
+        repaired = await Player.repair_card_counts(pool)
+        print(f"counts exact: {exact}, players repaired afterwards: {repaired}")
+        return exact and repaired == 0
+    finally:
+        async with pool.acquire() as connection:
+            await connection.execute("DELETE FROM user_data.user WHERE discord_user_id = ANY($1::BIGINT[]);", discord_user_ids)
+
+        await pool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", required=True, help="the database to check against")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=8, help="the amount of concurrent tasks per player")
+    parser.add_argument("--operations", type=int, default=200, help="how many grabs or burns every task makes")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not asyncio.run(_check(args.dsn, args.players, args.workers, args.operations, args.seed)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmarks the properties and comparisons of :class:`CardRarity` and :class:`CardCondition`.
+
+Sorting a collection by card value reads ``index`` of every rarity and condition,
+which makes it a good measure of how cheap the properties are.
+
+Run from the repository root::
+
+    python -m fancards.benchmarks.card_properties --output before.json
+    python -m fancards.benchmarks.card_properties --output after.json --baseline before.json
+"""
+from __future__ import annotations
+
+import json
+import random
+import timeit
+import argparse
+import datetime
+from typing import Callable, Optional, Any
+
+from fancards.database import CardTable
+from fancards.enums import CardRarity, CardCondition
+from fancards.factory import CardFactory
+from src.cogs.card import _calculate_card_value
+
+
+Case = tuple[str, Callable[[], Any]]
+
+COLLECTION_SIZE = 5000
+
+
+def _create_collection(size: int, rng: random.Random) -> list[CardTable]:
+    created_at = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        CardTable(
+            card_id=f"{index:06d}",
+            fk_user_id=1,
+            rarity=rng.choice(list(CardRarity)),
+            condition=rng.choice(list(CardCondition)),
+            character_name="Troll",
+            created_at=created_at,
+            is_shiny=rng.random() < 0.05
+        ) for index in range(size)
+    ]
+
+
+def _get_cases(rng: random.Random) -> list[Case]:
+    cards = _create_collection(COLLECTION_SIZE, rng)
+    rarities = [card.rarity for card in cards]
+    conditions = [card.condition for card in cards]
+    return [
+        (f"sort_by_card_value[{COLLECTION_SIZE}]", lambda: sorted(cards, key=_calculate_card_value)),
+        (f"sort_rarities[{COLLECTION_SIZE}]", lambda: sorted(rarities)),
+        (f"max_condition[{COLLECTION_SIZE}]", lambda: max(conditions)),
+        ("rarity_properties", lambda: [
+            (rarity.index, rarity.color, rarity.silver_values, rarity.star_value, rarity.weight) for rarity in CardRarity
+        ]),
+        ("condition_properties", lambda: [
+            (condition.index, condition.unicode, condition.star_value, condition.weight) for condition in CardCondition
+        ]),
+        ("upgrade_downgrade_condition", lambda: [
+            (CardFactory.upgrade_condition(condition), CardFactory.downgrade_condition(condition)) for condition in CardCondition
+        ])
+    ]
+
+
+def _print_results(results: dict[str, float], baseline: Optional[dict[str, float]]) -> None:
+    print(f"{'case':<32} {'ms':>10}" + (f" {'change':>9}" if baseline is not None else ""))
+    for name, milliseconds in results.items():
+        line = f"{name:<32} {milliseconds:>10.3f}"
+        if baseline is not None:
+            previous = baseline.get(name)
+            line += f" {'new':>9}" if previous is None else f" {(milliseconds - previous) / previous * 100:>+8.1f}%"
+
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="how many times each case is timed, the fastest run counts")
+    parser.add_argument("--seed", type=int, default=0, help="the seed for the random collection")
+    parser.add_argument("--output", help="save the results as JSON to this path")
+    parser.add_argument("--baseline", help="compare against the JSON results of a previous run")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+
+    results = {
+        name: min(timeit.repeat(func, number=1, repeat=args.repeat)) * 1000
+        for name, func in _get_cases(random.Random(args.seed))
+    }
+    _print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compares the lookups of the indexed :class:`CharacterCatalog` against rebuilding them on every call.
+
+The rebuilding lookups are copies of how :class:`Character` used to look up characters,
+kept here as the baseline.
+
+Run from the repository root::
+
+    python -m fancards.benchmarks.characters
+"""
+from __future__ import annotations
+
+import re
+import random
+import timeit
+import argparse
+from typing import Callable, Any
+
+from fancards.enums import CardRarity, Character
+from fancards.enums.character import CharacterData
+
+
+Case = tuple[str, Callable[[], Any], Callable[[], Any]]
+
+
+def _rebuild_all_characters() -> list[CharacterData]:
+    characters: list[CharacterData] = []
+    for character_rarity in Character:
+        characters.extend(character_rarity.value)
+
+    return characters
+
+
+def _rebuild_character_data(name: str) -> CharacterData:
+    character_mapping = {character.display_name: character for character in _rebuild_all_characters()}
+    if name in character_mapping:
+        return character_mapping[name]
+
+    raise ValueError(f"Character '{name}' does not exist.")
+
+
+def _rebuild_random_character(rarity: CardRarity) -> CharacterData:
+    if rarity.exclusive:
+        return random.choice(_rebuild_all_characters())
+
+    return random.choice(getattr(Character, rarity.name).value)
+
+
+def _regex_search(prefix: str) -> list[str]:
+    pattern = re.compile(f"^{prefix}.*", flags=re.IGNORECASE)
+    return [character.display_name for character in _rebuild_all_characters() if pattern.match(character.display_name)]
+
+
+def _get_cases() -> list[Case]:
+    catalog = Character.get_catalog()
+    name = catalog.characters[-1].display_name  # the last character is the slowest to find in a list
+    return [
+        ("get_all_characters", _rebuild_all_characters, Character.get_all_characters),
+        ("get_character_data", lambda: _rebuild_character_data(name), lambda: Character.get_character_data(name)),
+        ("get_random_character", lambda: _rebuild_random_character(CardRarity.EPIC), lambda: Character.get_random_character(CardRarity.EPIC)),
+        ("search[s]", lambda: _regex_search("s"), lambda: catalog.search("s")),
+        ("search[skill b]", lambda: _regex_search("skill b"), lambda: catalog.search("skill b"))
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=10_000, help="how many calls are timed per case")
+    args = parser.parse_args()
+
+    print(f"{'case':<24} {'rebuilt us':>11} {'indexed us':>11} {'speedup':>8}")
+    for name, rebuilt, indexed in _get_cases():
+        rebuilt_us = timeit.timeit(rebuilt, number=args.number) / args.number * 1_000_000
+        indexed_us = timeit.timeit(indexed, number=args.number) / args.number * 1_000_000
+        print(f"{name:<24} {rebuilt_us:>11.2f} {indexed_us:>11.2f} {rebuilt_us / indexed_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Simulates millions of drops per :class:`Weight` to check the drop distributions and currency inflow.
+
+Rarities, conditions and shiny states are drawn with the thresholds of :class:`DropSampler`,
+vectorized with numpy, and compared against their exact chances. Every card of every drop is
+assumed to be grabbed and later burned, which gives the expected currency per drop:
+
+- grab: silver between a third of the rarity's silver values and XP between 1 and 3, nothing for a Troll.
+- burn: silver between the rarity's silver values and the condition's stars, both with the bonus for
+  ``--card-age-days``, plus a glistening gem for a shiny card.
+
+Like the grab button, the shiny state is rerolled with the default weight on grab, and always shiny for patreons.
+
+Run from the repository root::
+
+    python -m fancards.benchmarks.economy --drops 1000000
+"""
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+
+from fancards.enums import Weight, CardRarity, CardCondition, Character
+from fancards.factory import DropSampler
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# mirrors _calculate_bonus_days in the card cog
+MAX_BONUS_DAYS = 60
+
+
+def _get_troll_shares(rarities: list[CardRarity]) -> list[float]:
+    """Returns the chance of a card of each rarity being a Troll, which rewards nothing when grabbed."""
+    shares: list[float] = []
+    for rarity in rarities:
+        characters = getattr(Character, rarity.name).value
+        shares.append(sum(character.display_name == "Troll" for character in characters) / len(characters))
+
+    return shares
+
+
+def _simulate(weight: Weight, drops: int, cards_per_drop: int, patreon: bool, card_age_days: int, rng: np.random.Generator) -> dict:
+    sampler = DropSampler.get(weight)
+    count = drops * cards_per_drop
+
+    rarities = [*sampler.rarities, sampler.default_rarity]
+    rarity_codes = np.searchsorted(np.array(sampler.rarity_bounds), rng.random(count) * 100, side="left")
+
+    all_conditions = list(CardCondition)
+    condition_sets = [*sampler.conditions, (CardCondition.GOOD,)]  # 'GOOD' if the random number is too high
+    condition_table = np.zeros((len(condition_sets), max(len(conditions) for conditions in condition_sets)), dtype=np.intp)
+    for index, conditions in enumerate(condition_sets):
+        condition_table[index, :len(conditions)] = [all_conditions.index(condition) for condition in conditions]
+
+    condition_set_sizes = np.array([len(conditions) for conditions in condition_sets])
+    set_codes = np.searchsorted(np.array(sampler.condition_bounds), rng.random(count) * 100, side="left")
+    choices = (rng.random(count) * condition_set_sizes[set_codes]).astype(np.intp)
+    condition_codes = condition_table[set_codes, choices]
+
+    if patreon:
+        is_shiny = np.ones(count, dtype=bool)
+    else:
+        is_shiny = rng.random(count) * 100 <= DropSampler.get().get_shiny_weight()
+
+    is_troll = rng.random(count) < np.array(_get_troll_shares(rarities))[rarity_codes]
+    grabbed = ~is_troll
+
+    silver_low = np.array([rarity.silver_values[0] for rarity in rarities])  # type: ignore
+    silver_high = np.array([rarity.silver_values[1] for rarity in rarities])  # type: ignore
+    star_values = np.array([condition.star_value for condition in all_conditions])
+    bonus_days = min(card_age_days, MAX_BONUS_DAYS)
+
+    grab_silver = rng.integers(silver_low[rarity_codes] // 3, silver_high[rarity_codes] // 3 + 1) * grabbed
+    grab_xp = rng.integers(1, 4, size=count) * grabbed
+
+    burn_silver = rng.integers(silver_low[rarity_codes], silver_high[rarity_codes] + 1)
+    burn_silver = (burn_silver + burn_silver // 4 * bonus_days) * grabbed
+    burn_star = star_values[condition_codes]
+    burn_star = (burn_star + burn_star // 4 * bonus_days) * grabbed
+    burn_gems = is_shiny & grabbed
+
+    rarity_counts = np.bincount(rarity_codes, minlength=len(rarities))
+    rarity_shares: dict[CardRarity, float] = {}
+    for index, rarity in enumerate(rarities):  # the default rarity can also have an interval of its own
+        rarity_shares[rarity] = rarity_shares.get(rarity, 0.0) + float(rarity_counts[index] / count * 100)
+
+    condition_counts = np.bincount(condition_codes, minlength=len(all_conditions))
+    rarity_chances = sampler.get_rarity_chances()
+    condition_chances = sampler.get_condition_chances()
+
+    return {
+        "rarities": {
+            rarity.name: {"simulated": share, "exact": rarity_chances[rarity]}
+            for rarity, share in rarity_shares.items()
+        },
+        "conditions": {
+            condition.name: {"simulated": float(condition_counts[index] / count * 100), "exact": condition_chances[condition]}
+            for index, condition in enumerate(all_conditions)
+        },
+        "shiny": float(is_shiny.mean() * 100),
+        "per_drop": {
+            "grab_silver": float(grab_silver.sum() / drops),
+            "grab_xp": float(grab_xp.sum() / drops),
+            "burn_silver": float(burn_silver.sum() / drops),
+            "burn_star": float(burn_star.sum() / drops),
+            "burn_glistening_gems": float(burn_gems.sum() / drops)
+        }
+    }
+
+
+def _print_result(weight: Weight, result: dict, elapsed: float) -> None:
+    print(f"\n{weight.name} ({elapsed:.2f}s)")
+    for table in ("rarities", "conditions"):
+        print(f"  {'rarity' if table == 'rarities' else 'condition':<10} {'simulated %':>12} {'exact %':>9}")
+        for name, chances in result[table].items():
+            print(f"  {name:<10} {chances['simulated']:>12.4f} {chances['exact']:>9.4f}")
+
+    print(f"  shiny on grab: {result['shiny']:.4f}%")
+    print("  per drop:")
+    for name, value in result["per_drop"].items():
+        print(f"    {name:<22} {value:>12,.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--drops", type=int, default=1_000_000, help="how many drops are simulated per weight")
+    parser.add_argument("--cards-per-drop", type=int, default=3)
+    parser.add_argument("--patreon", action="store_true", help="simulate grabs by patreons")
+    parser.add_argument("--card-age-days", type=int, default=0, help="how old the cards are when they are burned")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    if np is None:
+        sys.exit("numpy is not installed.")
+
+    rng = np.random.default_rng(args.seed)
+    for weight in Weight:
+        start = time.perf_counter()
+        result = _simulate(weight, args.drops, args.cards_per_drop, args.patreon, args.card_age_days, rng)
+        _print_result(weight, result, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Reports encode time and file size of every :class:`ImageEncoder` on real cards.
+
+Run from the repository root::
+
+    python -m fancards.benchmarks.encoders
+"""
+from __future__ import annotations
+
+import time
+import argparse
+import statistics
+
+from PIL import Image
+
+from fancards.enums import CardRarity, CardCondition, Weight
+from fancards.factory import CardFactory, ImageEncoder
+
+
+def _time_encoder(encoder: ImageEncoder, image: Image.Image, repeat: int) -> tuple[float, int]:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = encoder.encode(image)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings) * 1000, len(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="how many times each image is encoded")
+    args = parser.parse_args()
+
+    card = CardFactory.generate_card(
+        rarity=CardRarity.EPIC,
+        condition=CardCondition.NEAR_MINT,
+        character_name="Monster Match Knight",
+        shiny=True
+    )
+    drop = CardFactory.generate_cards(weight=Weight.NORMAL, show_card_id=False, show_card_condition=False)
+    images = {
+        "view": card.image,
+        "drop": CardFactory.align_card_images([card.image for card in drop])
+    }
+
+    print(f"{'image':<6} {'encoder':<14} {'ms':>8} {'bytes':>10}")
+    for name, image in images.items():
+        for encoder in ImageEncoder:
+            milliseconds, size = _time_encoder(encoder, image, args.repeat)
+            print(f"{name:<6} {encoder.name:<14} {milliseconds:>8.1f} {size:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Benchmarks the card factory and reports p50/p95 latency, allocations and peak RSS.
+
+Every case is timed ``--repeat`` times after one warm-up run. Allocations are the
+peak traced by :mod:`tracemalloc` over one extra run; Pillow allocates pixel data
+outside of Python, which only shows up in the peak RSS.
+
+Run from the repository root::
+
+    python -m fancards.benchmarks.factory --output before.json
+    python -m fancards.benchmarks.factory --output after.json --baseline before.json
+"""
+from __future__ import annotations
+
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tracemalloc
+from typing import Callable, Optional, Any
+
+import PIL
+
+from fancards.enums import CardRarity, CardCondition, Character
+from fancards.factory import CardFactory, ImageEncoder
+from fancards.utils import save_image_to_discord_file
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+Case = tuple[str, Callable[[], Any]]
+
+# the longest character names are the slowest to fit and draw
+LONGEST_NAME_COUNT = 5
+ALIGN_CARD_COUNTS = (3, 6, 10)
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Returns the nearest-rank ``percent`` percentile of ``values``."""
+    ordered = sorted(values)
+    index = max(round(percent / 100 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+def _get_peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS, kilobytes elsewhere
+
+
+def _run_case(func: Callable[[], Any], repeat: int, cold: bool) -> dict[str, float]:
+    func()  # warm up
+
+    timings: list[float] = []
+    for _ in range(repeat):
+        if cold:
+            CardFactory.base_image_cache.clear()
+            CardFactory.render_cache.clear()
+
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    func()
+    _, allocated_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "p50_ms": _percentile(timings, 50),
+        "p95_ms": _percentile(timings, 95),
+        "alloc_peak_kb": allocated_peak / 1024
+    }
+
+
+def _get_cases() -> list[Case]:
+    cases: list[Case] = []
+
+    for rarity in CardRarity:
+        for condition in CardCondition:
+            for shiny in (False, True):
+                cases.append((
+                    f"generate_card[{rarity.name}-{condition.name}-{'shiny' if shiny else 'plain'}]",
+                    lambda rarity=rarity, condition=condition, shiny=shiny: CardFactory.generate_card(
+                        rarity=rarity,
+                        condition=condition,
+                        shiny=shiny
+                    )
+                ))
+
+    base = CardFactory.generate_card(rarity=CardRarity.EPIC, show_card_condition=False)
+    for condition in CardCondition:
+        for shiny in (False, True):
+            cases.append((
+                f"add_texture[{condition.name}-{'shiny' if shiny else 'plain'}]",
+                lambda condition=condition, shiny=shiny: CardFactory.add_texture(base.image, condition, shiny)
+            ))
+
+    characters = sorted(Character.get_all_characters(), key=lambda character: len(character.display_name), reverse=True)
+    for character in characters[:LONGEST_NAME_COUNT]:
+        cases.append((
+            f"add_character_name[{character.display_name}]",
+            lambda name=character.display_name: CardFactory.add_character_name(base.image.copy(), name)
+        ))
+
+    for amount in ALIGN_CARD_COUNTS:
+        cards = CardFactory.generate_cards(amount=amount, show_card_id=False, show_card_condition=False)
+        cases.append((
+            f"align_card_images[{amount}]",
+            lambda images=[card.image for card in cards]: CardFactory.align_card_images(images)
+        ))
+
+    cases.append((
+        "condition_comparison",
+        lambda: CardFactory.condition_comparison(base, CardCondition.GOOD, CardCondition.NEAR_MINT)
+    ))
+
+    for encoder in ImageEncoder:
+        cases.append((
+            f"save_image_to_discord_file[{encoder.name}]",
+            lambda encoder=encoder: save_image_to_discord_file(base.image, filename="card", encoder=encoder)
+        ))
+
+    return cases
+
+
+def _print_results(results: dict[str, dict[str, float]], baseline: Optional[dict[str, dict[str, float]]]) -> None:
+    header = f"{'case':<52} {'p50 ms':>8} {'p95 ms':>8} {'alloc kb':>9}"
+    print(header + (f" {'p50 change':>11}" if baseline is not None else ""))
+
+    for name, result in results.items():
+        line = f"{name:<52} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['alloc_peak_kb']:>9.1f}"
+        if baseline is not None:
+            previous = baseline.get(name)
+            if previous is None:
+                line += f" {'new':>11}"
+            else:
+                change = (result["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] * 100
+                line += f" {change:>+10.1f}%"
+
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="how many times each case is timed")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--cold", action="store_true", help="clear the render caches before every timed run")
+    parser.add_argument("--seed", type=int, default=0, help="the seed for the random characters and card IDs")
+    parser.add_argument("--output", help="save the results as JSON to this path")
+    parser.add_argument("--baseline", help="compare against the JSON results of a previous run")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)["results"]
+
+    results = {
+        name: _run_case(func, args.repeat, args.cold)
+        for name, func in _get_cases() if args.filter in name
+    }
+    _print_results(results, baseline)
+
+    peak_rss_kb = _get_peak_rss_kb()
+    if peak_rss_kb is not None:
+        print(f"\npeak RSS: {peak_rss_kb / 1024:.1f} MiB")
+
+    if args.output:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "pillow": PIL.__version__,
+                "platform": platform.platform(),
+                "repeat": args.repeat,
+                "cold": args.cold,
+                "seed": args.seed,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z")
+            },
+            "peak_rss_kb": peak_rss_kb,
+            "results": results
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Generic, TypeVar, Optional, Callable
+
+
+__all__ = ("LRUCache",)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe least recently used cache.
+
+    Attributes
+    ----------
+    maxsize: Optional[:class:`int`]
+        The maximum amount of entries kept before the least recently used one is evicted.
+    max_bytes: Optional[:class:`int`]
+        The maximum total size of the entries as measured by ``sizeof``.
+    nbytes: :class:`int`
+        The current total size of the entries as measured by ``sizeof``.
+    hits: :class:`int`
+        How many lookups found an entry.
+    misses: :class:`int`
+        How many lookups did not find an entry.
+    """
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        *,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[V], int]] = None
+    ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._sizeof = sizeof or (lambda value: 0)
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: K) -> Optional[V]:
+        """Returns the entry of ``key`` and marks it as recently used; ``None`` if there is no entry."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: K, value: V) -> None:
+        """Stores ``value`` under ``key``, evicting the least recently used entries if the cache is full."""
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._sizeof(self._entries.pop(key))
+
+            self._entries[key] = value
+            self.nbytes += self._sizeof(value)
+
+            while self._entries and self._is_full():
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= self._sizeof(evicted)
+
+    def invalidate(self, key: K) -> None:
+        """Removes the entry of ``key`` if there is one."""
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._sizeof(self._entries.pop(key))
+
+    def invalidate_if(self, predicate: Callable[[K], bool]) -> None:
+        """Removes every entry whose key matches ``predicate``."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self.nbytes -= self._sizeof(self._entries.pop(key))
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def _is_full(self) -> bool:
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            return True
+
+        return self.max_bytes is not None and self.nbytes > self.max_bytes
@@ -0,0 +1,103 @@
+"""Renders the full card catalog on every core and reports the throughput.
+
+The catalog is every character at its own rarity in every :class:`CardCondition`,
+with and without shiny. Characters are rendered on a process pool, one job per
+character so that every worker reuses the base layer of the character.
+
+Catalog cards are not stored and have no card ID, so they are written into
+``--output`` rather than the render caches, which are addressed by card ID and
+live in the bot's process. Use the output to review the artwork of a release,
+or leave it out to only measure throughput.
+
+Run from the repository root::
+
+    python -m fancards.catalog --output catalog/
+"""
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import argparse
+from typing import Optional
+
+from fancards.enums import CardCondition, Character
+from fancards.factory import CardFactory, CardRenderer, CardSpec, ImageEncoder
+
+
+# catalog cards are not stored, so they all show the same placeholder ID
+CATALOG_CARD_ID = "000000"
+
+
+def _render_character(
+    character_name: str,
+    encoder: ImageEncoder,
+    scale: float,
+    output: Optional[str]
+) -> tuple[int, int]:
+    """Renders and encodes every card of a character, writing them to ``output`` if given.
+
+    Returns the amount of cards and their total size in bytes.
+    """
+    character = Character.get_character_data(character_name)
+    count = 0
+    nbytes = 0
+
+    for condition in CardCondition:
+        for shiny in (False, True):
+            spec = CardSpec(
+                card_id=CATALOG_CARD_ID,
+                rarity=character.rarity,
+                condition=condition,
+                character_name=character_name,
+                is_shiny=shiny
+            )
+            data = encoder.encode(CardFactory.reveal_card(spec, scale))
+            count += 1
+            nbytes += len(data)
+
+            if output is not None:
+                filename = f"{character.reference_name}_{condition.name.lower()}_{'shiny' if shiny else 'plain'}.{encoder.extension}"
+                with open(os.path.join(output, filename), "wb") as file:
+                    file.write(data)
+
+    return count, nbytes
+
+
+async def _render_catalog(workers: int, encoder: ImageEncoder, scale: float, output: Optional[str]) -> tuple[int, int]:
+    characters = Character.get_all_characters()
+    # every character is submitted at once, so the queue has to fit all of them
+    renderer = CardRenderer(executor="process", max_workers=workers, queue_size=len(characters))
+    try:
+        results = await asyncio.gather(*[
+            renderer.run(_render_character, character.display_name, encoder, scale, output)
+            for character in characters
+        ])
+    finally:
+        renderer.close()
+
+    return sum(count for count, _ in results), sum(nbytes for _, nbytes in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="the amount of worker processes")
+    parser.add_argument("--encoder", choices=[encoder.name for encoder in ImageEncoder], default=ImageEncoder.WEBP_LOSSLESS.name)
+    parser.add_argument("--scale", type=float, default=1.0, help="the size of the cards relative to the full card")
+    parser.add_argument("--output", help="write the encoded cards into this directory instead of discarding them")
+    args = parser.parse_args()
+
+    if args.output is not None:
+        os.makedirs(args.output, exist_ok=True)
+
+    start = time.perf_counter()
+    count, nbytes = asyncio.run(_render_catalog(args.workers, ImageEncoder[args.encoder], args.scale, args.output))
+    elapsed = time.perf_counter() - start
+
+    cards_per_second = count / elapsed
+    print(f"rendered {count:,} cards ({nbytes / 1024 / 1024:.1f} MiB) in {elapsed:.2f}s with {args.workers} workers")
+    print(f"{cards_per_second:.1f} cards/s, {cards_per_second / args.workers:.1f} cards/s per core")
+
+
+if __name__ == "__main__":
+    main()
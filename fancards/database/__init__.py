@@ -1,2 +1,3 @@
 from .data import *
+from .migrations import *
 from .psql import *
\ No newline at end of file
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
+from dataclasses import dataclass
 
 import discord
 
@@ -15,6 +16,7 @@ if TYPE_CHECKING:
     from bot import Fancards
 
 __all__ = (
+    "PlayerContext",
     "Player",
     "Balance",
     "Level",
@@ -88,16 +90,62 @@ class UserData:
         The database pool.
     discord_user_id: :class:`int`
         The ID of the user in Discord.
+    fk_user_id: Optional[:class:`int`]
+        The primary key ID of the user in ``user_data.user`` if it is already known.
+        Writes use it directly instead of looking it up by ``discord_user_id``.
     """    
-    def __init__(self, pool: Pool[Record], discord_user_id: int):
+    def __init__(self, pool: Pool[Record], discord_user_id: int, fk_user_id: Optional[int] = None):
         self.pool = pool
         self.discord_user_id = discord_user_id
+        self.fk_user_id = fk_user_id
+
+    def _get_user_id_expression(self, placeholder: str) -> tuple[str, int]:
+        """Returns the SQL expression of the user's primary key ID and the argument for its ``placeholder``."""
+        if self.fk_user_id is not None:
+            return placeholder, self.fk_user_id
+
+        return f"(SELECT id FROM user_data.user WHERE discord_user_id = {placeholder})", self.discord_user_id
+
+
+@dataclass(frozen=True)
+class PlayerContext:
+    """A snapshot of a registered player, loaded with a single query.
+    
+    Attributes
+    ----------
+    player: :class:`Player`
+        The player, whose writes use the resolved ``fk_user_id``.
+    user: :class:`UserTable`
+        The ``user_data.user`` row of the player.
+    balance: :class:`BalanceTable`
+        The ``user_data.balance`` row of the player.
+    level: :class:`LevelTable`
+        The ``user_data.level`` row of the player.
+    card_count: :class:`int`
+        The amount of cards the player owns.
+    backpack_capacity: Optional[:class:`int`]
+        The capacity of the player's backpack; ``None`` if the backpack is at maximum level.
+    """
+    player: Player
+    user: UserTable
+    balance: BalanceTable
+    level: LevelTable
+    card_count: int
+    backpack_capacity: Optional[int]
+
+    @property
+    def fk_user_id(self) -> int:
+        return self.user.id
+
+    @property
+    def is_backpack_full(self) -> bool:
+        return self.backpack_capacity is not None and self.card_count >= self.backpack_capacity
 
 
 class Player(UserData):
     """A helper class for the ``user_data.user`` table."""
-    def __init__(self, pool: Pool[Record], discord_user_id: int):
-        super().__init__(pool, discord_user_id)
+    def __init__(self, pool: Pool[Record], discord_user_id: int, fk_user_id: Optional[int] = None):
+        super().__init__(pool, discord_user_id, fk_user_id)
         self.base_backpack_capacity = 500
         self.max_backpack_level = 5
      
@@ -128,6 +176,85 @@ class Player(UserData):
                 return fk_user_id
             
         return player_table.id
+
+    async def get_context(self) -> PlayerContext:
+        """Loads the player's user, balance and level rows and card count in a single query.
+        
+        The player is registered first if they are not registered yet, and a missing
+        balance or level row is created with the default values.
+
+        Returns
+        -------
+        :class:`PlayerContext`
+            The snapshot of the player.
+        """
+        context = await self._fetch_context()
+        if context is None:
+            await self.register()
+            context = await self._fetch_context()
+
+        assert context
+        return context
+
+    async def _fetch_context(self) -> Optional[PlayerContext]:
+        """Returns ``None`` if the player is not registered."""
+        query = """
+        SELECT player.*,
+            balance.fk_user_id AS balance_fk_user_id, balance.silver, balance.star, balance.gem, balance.voucher,
+            level.fk_user_id AS level_fk_user_id, level.current_level, level.current_xp, level.required_xp
+        FROM user_data.user AS player
+        LEFT JOIN user_data.balance AS balance ON balance.fk_user_id = player.id
+        LEFT JOIN user_data.level AS level ON level.fk_user_id = player.id
+        WHERE player.discord_user_id = $1;
+        """
+        async with self.pool.acquire() as connection:
+            result = await connection.fetchrow(query, self.discord_user_id)
+            if result is None:
+                return None
+
+            if result["balance_fk_user_id"] is None or result["level_fk_user_id"] is None:
+                # the balance or level of the player got lost, give them the ones of a new player.
+                # Locking the user makes concurrent grabs wait here, so only the first one inserts.
+                async with connection.transaction():
+                    await connection.execute("SELECT id FROM user_data.user WHERE id = $1 FOR UPDATE;", result["id"])
+                    for table in ("balance", "level"):
+                        await connection.execute(
+                            f"""
+                            INSERT INTO user_data.{table} (fk_user_id)
+                            SELECT $1 WHERE NOT EXISTS (SELECT 1 FROM user_data.{table} WHERE fk_user_id = $1);
+                            """,
+                            result["id"]
+                        )
+
+                result = await connection.fetchrow(query, self.discord_user_id)
+                assert result
+
+        user = UserTable(
+            id=result["id"],
+            discord_user_id=result["discord_user_id"],
+            registered_at=result["registered_at"],
+            backpack_level=result["backpack_level"],
+            card_count=result["card_count"]
+        )
+        return PlayerContext(
+            player=Player(self.pool, self.discord_user_id, user.id),
+            user=user,
+            balance=BalanceTable(
+                fk_user_id=user.id,
+                silver=result["silver"],
+                star=result["star"],
+                gem=result["gem"],
+                voucher=result["voucher"]
+            ),
+            level=LevelTable(
+                fk_user_id=user.id,
+                current_level=result["current_level"],
+                current_xp=result["current_xp"],
+                required_xp=result["required_xp"]
+            ),
+            card_count=user.card_count,
+            backpack_capacity=self.calculate_backpack_capacity(user.backpack_level)
+        )
         
     async def get_table(self) -> Optional[UserTable]:
         async with self.pool.acquire() as connection:
@@ -140,6 +267,59 @@ class Player(UserData):
         if result is not None:
             return UserTable(**dict(result))
     
+    async def card_count(self) -> int:
+        """Returns the amount of cards the player owns, ``0`` if they are not registered.
+        
+        The count is kept up to date by triggers on ``user_data.card``, so no cards are loaded.
+        """
+        query = """
+        SELECT card_count FROM user_data.user
+        WHERE discord_user_id = $1;
+        """
+        async with self.pool.acquire() as connection:
+            result = await connection.fetchval(query, self.discord_user_id)
+
+        return result or 0
+
+    @staticmethod
+    async def repair_card_counts(pool: Pool[Record]) -> int:
+        """Recounts the cards of every player and fixes the counts that are off.
+        
+        The counts are kept up to date by triggers, so this is only needed after they were
+        changed by hand, e.g. from the owner-only ``repair-card-counts`` command. The cards
+        are locked against changes while they are counted, so grabs and burns wait for the
+        repair instead of being overwritten by it.
+        
+        Parameters
+        ----------
+        pool: asyncpg.Pool[:class:`asyncpg.Record`]
+            The database pool.
+        
+        Returns
+        -------
+        :class:`int`
+            The amount of players whose count was fixed.
+        """
+        query = """
+        WITH counted AS (
+            SELECT player.id, COUNT(card.card_id) AS card_count
+            FROM user_data.user AS player
+            LEFT JOIN user_data.card AS card ON card.fk_user_id = player.id
+            GROUP BY player.id
+        )
+        UPDATE user_data.user AS player
+        SET card_count = counted.card_count
+        FROM counted
+        WHERE player.id = counted.id AND player.card_count <> counted.card_count
+        RETURNING player.id;
+        """
+        async with pool.acquire() as connection:
+            async with connection.transaction():
+                await connection.execute("LOCK TABLE user_data.card IN SHARE MODE;")
+                results = await connection.fetch(query)
+
+        return len(results)
+
     async def add_backpack_level(self) -> None:
         query = """
         UPDATE user_data.user
@@ -164,10 +344,13 @@ class Player(UserData):
         """
         player_table = await self.get_table()
         if player_table is not None:
-            backpack_level = player_table.backpack_level
-            return backpack_level * self.base_backpack_capacity if backpack_level < self.max_backpack_level else None
+            return self.calculate_backpack_capacity(player_table.backpack_level)
         
         raise ValueError("Player is not registered.")
+
+    def calculate_backpack_capacity(self, backpack_level: int) -> Optional[int]:
+        """Returns the capacity of a backpack at ``backpack_level``; ``None`` if it is the maximum level."""
+        return backpack_level * self.base_backpack_capacity if backpack_level < self.max_backpack_level else None
     
     @property
     async def is_registered(self) -> bool:
@@ -176,19 +359,19 @@ class Player(UserData):
 
     @property
     def balance(self) -> Balance:
-        return Balance(self.pool, self.discord_user_id)
+        return Balance(self.pool, self.discord_user_id, self.fk_user_id)
     
     @property
     def level(self) -> Level:
-        return Level(self.pool, self.discord_user_id)
+        return Level(self.pool, self.discord_user_id, self.fk_user_id)
     
     @property
     def inventory(self) -> Inventory:
-        return Inventory(self.pool, self.discord_user_id)
+        return Inventory(self.pool, self.discord_user_id, self.fk_user_id)
     
     @property
     def collection(self) -> Card:
-        return Card(self.pool, self.discord_user_id)
+        return Card(self.pool, self.discord_user_id, self.fk_user_id)
 
 
 class Balance(UserData):
@@ -208,16 +391,14 @@ class Balance(UserData):
         return BalanceTable(**dict(result))
     
     async def _add_currency(self, currency: enums.Currency, amount: int) -> None:
+        user_id_expression, user_id = self._get_user_id_expression("$2")
         query = f"""
         UPDATE user_data.balance
         SET {currency.name} = {currency.name} + $1
-        WHERE fk_user_id = (
-            SELECT id FROM user_data.user
-            WHERE discord_user_id = $2
-        );
+        WHERE fk_user_id = {user_id_expression};
         """
         async with self.pool.acquire() as connection:
-            await connection.execute(query, amount, self.discord_user_id)
+            await connection.execute(query, amount, user_id)
     
     async def add_silver(self, amount: int) -> None:
         await self._add_currency(enums.Currency.SILVER, amount)
@@ -246,8 +427,8 @@ class Balance(UserData):
 
 class Level(UserData):
     """A helper class for the ``user_data.level`` table."""  
-    def __init__(self, pool: Pool[Record], discord_user_id: int):
-        super().__init__(pool, discord_user_id)
+    def __init__(self, pool: Pool[Record], discord_user_id: int, fk_user_id: Optional[int] = None):
+        super().__init__(pool, discord_user_id, fk_user_id)
         self.max_level = 100
 
     async def get_table(self) -> Optional[LevelTable]:
@@ -284,57 +465,71 @@ class Level(UserData):
             level = self.max_level - current_level
             next_level = level
         
-        query = """
+        user_id_expression, user_id = self._get_user_id_expression("$3")
+        query = f"""
         UPDATE user_data.level
         SET current_level = current_level + $1,
             current_xp = 0,
             required_xp = $2
-        WHERE fk_user_id = (
-            SELECT id FROM user_data.user
-            WHERE discord_user_id = $3
-        );
+        WHERE fk_user_id = {user_id_expression};
         """
         async with self.pool.acquire() as connection:
-            await connection.execute(query, level, self.calculate_required_xp(next_level), self.discord_user_id)
+            await connection.execute(query, level, self.calculate_required_xp(next_level), user_id)
 
     async def add_xp(self, xp: int, interaction: Optional[discord.Interaction] = None) -> None:
-        level_table = await self.get_table()
-        if level_table is None:
-            return None
+        """Adds ``xp`` to the player, levelling them up if enough XP is reached.
         
-        current_level = level_table.current_level
-        previous_level = current_level
-        current_xp = level_table.current_xp
-        required_xp = level_table.required_xp
+        The level is locked from reading it until the new one is written, so concurrent
+        grabs of the same player add their XP one after another instead of overwriting it.
 
+        Parameters
+        ----------
+        xp: :class:`int`
+            The amount of XP.
+        interaction: Optional[:class:`discord.Interaction`]
+            The Discord interaction, to double the XP of patreons and notify about level ups.
+        """
         if interaction is not None and isinstance(interaction.user, discord.Member):
             if has_minimum_patreon_role(interaction.user, enums.PatreonRole.UNCOMMON):
                 xp *= 2
-        
-        current_xp += xp
-        while current_xp >= required_xp:
-            if current_level < self.max_level:
-                current_level += 1
 
-            current_xp -= required_xp
-            required_xp = self.calculate_required_xp(current_level)
-
-            if current_level == self.max_level:
-                current_xp = required_xp
-                break
-        
-        query = """
+        user_id_expression, user_id = self._get_user_id_expression("$1")
+        select_query = f"""
+        SELECT * FROM user_data.level
+        WHERE fk_user_id = {user_id_expression}
+        FOR UPDATE;
+        """
+        update_query = """
         UPDATE user_data.level
         SET current_level = $1,
             current_xp = $2,
             required_xp = $3
-        WHERE fk_user_id = (
-            SELECT id FROM user_data.user
-            WHERE discord_user_id = $4
-        );
+        WHERE fk_user_id = $4;
         """
         async with self.pool.acquire() as connection:
-            await connection.execute(query, current_level, current_xp, required_xp, self.discord_user_id)
+            async with connection.transaction():
+                result = await connection.fetchrow(select_query, user_id)
+                if result is None:
+                    return None
+
+                level_table = LevelTable(**dict(result))
+                current_level = level_table.current_level
+                previous_level = current_level
+                current_xp = level_table.current_xp + xp
+                required_xp = level_table.required_xp
+
+                while current_xp >= required_xp:
+                    if current_level < self.max_level:
+                        current_level += 1
+
+                    current_xp -= required_xp
+                    required_xp = self.calculate_required_xp(current_level)
+
+                    if current_level == self.max_level:
+                        current_xp = required_xp
+                        break
+
+                await connection.execute(update_query, current_level, current_xp, required_xp, level_table.fk_user_id)
 
         if previous_level != current_level:
             await NotificationManager.handle_level_up(interaction, previous_level)
@@ -477,17 +672,15 @@ class Inventory(UserData):
             return ItemTable.record_to_table(result)
         
     async def add_item(self, item: enums.Item, quantity: int = 1) -> None:
-        query = """
+        user_id_expression, user_id = self._get_user_id_expression("$1")
+        query = f"""
         INSERT INTO user_data.item AS item (fk_user_id, item_name, item_quantity)
-        VALUES ((
-            SELECT id FROM user_data.user
-            WHERE discord_user_id = $1
-        ), $2, $3)
+        VALUES ({user_id_expression}, $2, $3)
         ON CONFLICT (item_name, fk_user_id)
         DO UPDATE SET item_quantity = item.item_quantity + $3;
         """
         async with self.pool.acquire() as connection:
-            await connection.execute(query, self.discord_user_id, item.display_name, quantity)
+            await connection.execute(query, user_id, item.display_name, quantity)
 
 
 class RewardsDaily(UserData):
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from asyncpg import Connection, Pool, Record
+
+__all__ = (
+    "run_migrations",
+)
+
+log = logging.getLogger(__name__)
+
+# schema changes that lock busy tables live here instead of schema.sql, which every pooled connection runs
+_CARD_COUNT_APPLIED = """
+SELECT EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = 'user_data' AND table_name = 'user' AND column_name = 'card_count'
+) AND (
+    SELECT COUNT(*) FROM pg_trigger
+    WHERE tgrelid = 'user_data.card'::regclass
+    AND tgname IN ('card_count_insert_delete', 'card_count_update')
+) = 2;
+"""
+
+_CARD_COUNT_STATEMENTS = """
+-- the amount of cards every user owns, kept up to date by the triggers below
+ALTER TABLE user_data.user ADD COLUMN IF NOT EXISTS card_count INTEGER NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION user_data.update_card_count() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.fk_user_id IS NOT NULL THEN
+        UPDATE user_data.user SET card_count = card_count + 1 WHERE id = NEW.fk_user_id;
+    END IF;
+
+    IF TG_OP IN ('DELETE', 'UPDATE') AND OLD.fk_user_id IS NOT NULL THEN
+        UPDATE user_data.user SET card_count = card_count - 1 WHERE id = OLD.fk_user_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS card_count_insert_delete ON user_data.card;
+CREATE TRIGGER card_count_insert_delete
+    AFTER INSERT OR DELETE ON user_data.card
+    FOR EACH ROW EXECUTE FUNCTION user_data.update_card_count();
+
+DROP TRIGGER IF EXISTS card_count_update ON user_data.card;
+CREATE TRIGGER card_count_update
+    AFTER UPDATE OF fk_user_id ON user_data.card
+    FOR EACH ROW WHEN (OLD.fk_user_id IS DISTINCT FROM NEW.fk_user_id)
+    EXECUTE FUNCTION user_data.update_card_count();
+
+-- the triggers lock the cards against changes until the commit, so the counts start out exact
+UPDATE user_data.user AS player
+SET card_count = (SELECT COUNT(*) FROM user_data.card AS card WHERE card.fk_user_id = player.id);
+"""
+
+
+async def _migrate_card_count(connection: Connection[Record]) -> bool:
+    if await connection.fetchval(_CARD_COUNT_APPLIED):
+        return False
+
+    async with connection.transaction():
+        # bots starting at the same time wait for the first one, then see the migration as applied
+        await connection.execute("SELECT pg_advisory_xact_lock(hashtext('fancards.migrations'));")
+        if await connection.fetchval(_CARD_COUNT_APPLIED):
+            return False
+
+        await connection.execute(_CARD_COUNT_STATEMENTS)
+
+    return True
+
+
+async def run_migrations(pool: Pool[Record]) -> list[str]:
+    """Applies the schema changes that are not applied yet, meant to run once on startup.
+
+    Whether a change is applied is looked up in the catalog first, so an up to date
+    database is not locked at all. A change that is missing is applied in its own
+    transaction, e.g. adding ``user_data.user.card_count`` with its triggers and
+    counting the cards of every user.
+
+    Parameters
+    ----------
+    pool: asyncpg.Pool[:class:`asyncpg.Record`]
+        The database pool.
+
+    Returns
+    -------
+    list[:class:`str`]
+        The names of the applied changes.
+    """
+    applied: list[str] = []
+    async with pool.acquire() as connection:
+        if await _migrate_card_count(connection):
+            applied.append("card_count")
+
+    for name in applied:
+        log.info("Applied the %s migration.", name)
+
+    return applied
@@ -55,6 +55,7 @@ class UserTable(UserData):
     discord_user_id: int
     registered_at: datetime.datetime
     backpack_level: int = 1
+    card_count: int = 0
 
 
 @dataclass(frozen=True)
@@ -37,6 +37,9 @@ CREATE TABLE IF NOT EXISTS user_data.card (
     in_sleeve BOOLEAN DEFAULT FALSE
 );
 
+-- numbers of the card IDs handed out by the card ID allocator, one for every six-character card ID
+CREATE SEQUENCE IF NOT EXISTS user_data.card_id_seq MAXVALUE 2176782336;
+
 CREATE TABLE IF NOT EXISTS user_data.item (
     fk_user_id INTEGER REFERENCES user_data.user(id) ON DELETE CASCADE,
     item_name TEXT,
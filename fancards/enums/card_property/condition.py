@@ -21,6 +21,8 @@ class CardCondition(Enum):
     
     Supports rich comparison.
     """
+    _data: CardConditionData
+
     DAMAGED = "damaged" 
     POOR = "poor" 
     GOOD = "good" 
@@ -35,22 +37,22 @@ class CardCondition(Enum):
         return hash(self.value)
     
     def __eq__(self, other: Self) -> bool:
-        return self.index == other.index
+        return self._data.index == other._data.index
     
     def __ne__(self, other: Self) -> bool:
-        return self.index != other.index
+        return self._data.index != other._data.index
 
     def __lt__(self, other: Self) -> bool:
-        return self.index < other.index
+        return self._data.index < other._data.index
     
     def __le__(self, other: Self) -> bool:
-        return self.index <= other.index
+        return self._data.index <= other._data.index
 
     def __gt__(self, other: Self) -> bool:
-        return self.index > other.index
+        return self._data.index > other._data.index
     
     def __ge__(self, other: Self) -> bool:
-        return self.index >= other.index
+        return self._data.index >= other._data.index
 
     @property
     def display_name(self) -> str:
@@ -58,88 +60,114 @@ class CardCondition(Enum):
 
     @property
     def index(self) -> int:
-        return self.get_data().index
+        return self._data.index
     
     @property
     def unicode(self) -> str:
-        return self.get_data().unicode
+        return self._data.unicode
     
     @property
     def star_value(self) -> int:
-        return self.get_data().star_value
+        return self._data.star_value
     
     @property
     def weight(self) -> Optional[WeightData]:
-        return self.get_data().weight
+        return self._data.weight
     
     def display(self) -> str:
         return f"`{self.display_name.title()} {self.unicode}`"
+
+    def get_upgrade(self) -> Self:
+        """Returns the condition above, the condition itself if it is the best one."""
+        return _upgrades[self]
+
+    def get_downgrade(self) -> Self:
+        """Returns the condition below, the condition itself if it is the worst one."""
+        return _downgrades[self]
     
     def get_data(self) -> CardConditionData:
-        mapping = {
-            self.DAMAGED: CardConditionData(
-                index=1,
-                unicode="▱▱▱▱▱",
-                star_value=3,
-                weight=WeightData(
-                    new_user=16,
-                    normal=10,
-                    premium=10
-                )
-            ),
-            self.POOR: CardConditionData(
-                index=2,
-                unicode="▰▱▱▱▱",
-                star_value=12,
-                weight=WeightData(
-                    new_user=45,
-                    normal=20,
-                    premium=20
-                )
-            ),
-            self.GOOD: CardConditionData(
-                index=3,
-                unicode="▰▰▱▱▱",
-                star_value=33,
-                weight=WeightData(
-                    new_user=25,
-                    normal=45,
-                    premium=45
-                )
-            ),
-            self.NEAR_MINT: CardConditionData(
-                index=4,
-                unicode="▰▰▰▱▱",
-                star_value=72,
-                weight=WeightData(
-                    new_user=10,
-                    normal=19,
-                    premium=18.5
-                )
-            ),
-            self.MINT: CardConditionData(
-                index=5,
-                unicode="▰▰▰▰▱",
-                star_value=138,
-                weight=WeightData(
-                    new_user=3,
-                    normal=5,
-                    premium=5
-                )
-            ),
-            self.PRISTINE: CardConditionData(
-                index=6,
-                unicode="▰▰▰▰▰",
-                star_value=228,
-                weight=WeightData(
-                    new_user=1,
-                    normal=1,
-                    premium=1.5
-                )
+        return self._data
+
+
+def _create_data() -> dict[CardCondition, CardConditionData]:
+    return {
+        CardCondition.DAMAGED: CardConditionData(
+            index=1,
+            unicode="▱▱▱▱▱",
+            star_value=3,
+            weight=WeightData(
+                new_user=16,
+                normal=10,
+                premium=10
             )
-        }
-        return mapping[self]
-    
+        ),
+        CardCondition.POOR: CardConditionData(
+            index=2,
+            unicode="▰▱▱▱▱",
+            star_value=12,
+            weight=WeightData(
+                new_user=45,
+                normal=20,
+                premium=20
+            )
+        ),
+        CardCondition.GOOD: CardConditionData(
+            index=3,
+            unicode="▰▰▱▱▱",
+            star_value=33,
+            weight=WeightData(
+                new_user=25,
+                normal=45,
+                premium=45
+            )
+        ),
+        CardCondition.NEAR_MINT: CardConditionData(
+            index=4,
+            unicode="▰▰▰▱▱",
+            star_value=72,
+            weight=WeightData(
+                new_user=10,
+                normal=19,
+                premium=18.5
+            )
+        ),
+        CardCondition.MINT: CardConditionData(
+            index=5,
+            unicode="▰▰▰▰▱",
+            star_value=138,
+            weight=WeightData(
+                new_user=3,
+                normal=5,
+                premium=5
+            )
+        ),
+        CardCondition.PRISTINE: CardConditionData(
+            index=6,
+            unicode="▰▰▰▰▰",
+            star_value=228,
+            weight=WeightData(
+                new_user=1,
+                normal=1,
+                premium=1.5
+            )
+        )
+    }
+
+
+# the data never changes, so it is created once and stored on every member instead of on every access
+for _member, _data in _create_data().items():
+    _member._data = _data
+
+_ordered_conditions = sorted(CardCondition)
+_upgrades = {
+    condition: _ordered_conditions[min(position + 1, len(_ordered_conditions) - 1)]
+    for position, condition in enumerate(_ordered_conditions)
+}
+_downgrades = {
+    condition: _ordered_conditions[max(position - 1, 0)]
+    for position, condition in enumerate(_ordered_conditions)
+}
+
 
 class Texture(Enum):
     """Represents a texture image."""
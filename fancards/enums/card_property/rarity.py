@@ -29,6 +29,8 @@ class CardRarity(Enum):
     
     Supports rich comparison.
     """
+    _data: CardRarityData
+
     COMMON = "common"
     UNCOMMON = "uncommon"
     RARE = "rare"
@@ -46,22 +48,22 @@ class CardRarity(Enum):
         return hash(self.value)
     
     def __eq__(self, other: Self) -> bool:
-        return self.index == other.index
+        return self._data.index == other._data.index
     
     def __ne__(self, other: Self) -> bool:
-        return self.index != other.index
+        return self._data.index != other._data.index
 
     def __lt__(self, other: Self) -> bool:
-        return self.index < other.index
+        return self._data.index < other._data.index
     
     def __le__(self, other: Self) -> bool:
-        return self.index <= other.index
+        return self._data.index <= other._data.index
 
     def __gt__(self, other: Self) -> bool:
-        return self.index > other.index
+        return self._data.index > other._data.index
     
     def __ge__(self, other: Self) -> bool:
-        return self.index >= other.index
+        return self._data.index >= other._data.index
     
     @property
     def display_name(self) -> str:
@@ -74,27 +76,27 @@ class CardRarity(Enum):
 
     @property
     def index(self) -> int:
-        return self.get_data().index
+        return self._data.index
 
     @property
     def exclusive(self) -> bool:
-        return self.get_data().exclusive
+        return self._data.exclusive
     
     @property
     def color(self) -> Color:
-        return self.get_data().color
+        return self._data.color
     
     @property
     def silver_values(self) -> Optional[tuple[int, int]]:
-        return self.get_data().silver_values
+        return self._data.silver_values
     
     @property
     def star_value(self) -> Optional[int]:
-        return self.get_data().star_value
+        return self._data.star_value
     
     @property
     def weight(self) -> Optional[WeightData]:
-        return self.get_data().weight
+        return self._data.weight
     
     @property
     def is_valuable(self) -> bool:
@@ -113,120 +115,129 @@ class CardRarity(Enum):
         return [rarity for rarity in cls if rarity.exclusive]
     
     def get_data(self) -> CardRarityData:
-        mapping = {
-            self.COMMON: CardRarityData(
-                index=1,
-                exclusive=False,
-                color=Fancolor.GRAY(),
-                silver_values=(10, 40),
-                star_value=3,
-                letter_emoji=DiscordEmoji.RARITY_LETTER_COMMON,
-                card_emoji=DiscordEmoji.RARITY_CARD_COMMON,
-                weight=WeightData(
-                    new_user=65,
-                    normal=46.5,
-                    premium=None
-                )
-            ),
-            self.UNCOMMON: CardRarityData(
-                index=2,
-                exclusive=False,
-                color=Fancolor.LIGHT_GREEN(),
-                silver_values=(50, 75),
-                star_value=12,
-                letter_emoji=DiscordEmoji.RARITY_LETTER_UNCOMMON,
-                card_emoji=DiscordEmoji.RARITY_CARD_UNCOMMON,
-                weight=WeightData(
-                    new_user=20,
-                    normal=30,
-                    premium=50
-                )
-            ),
-            self.RARE: CardRarityData(
-                index=3,
-                exclusive=False,
-                color=Fancolor.LIGHT_BLUE(),
-                silver_values=(100, 350),
-                star_value=33,
-                letter_emoji=DiscordEmoji.RARITY_LETTER_RARE,
-                card_emoji=DiscordEmoji.RARITY_CARD_RARE,
-                weight=WeightData(
-                    new_user=10,
-                    normal=16.1,
-                    premium=30
-                )
-            ),
-            self.EPIC: CardRarityData(
-                index=4,
-                exclusive=False,
-                color=Fancolor.LIGHT_PURPLE(),
-                silver_values=(500, 750),
-                star_value=72,
-                letter_emoji=DiscordEmoji.RARITY_LETTER_EPIC,
-                card_emoji=DiscordEmoji.RARITY_CARD_EPIC,
-                weight=WeightData(
-                    new_user=5,
-                    normal=6,
-                    premium=16.5
-                )
-            ),
-            self.MYTHIC: CardRarityData(
-                index=5,
-                exclusive=False,
-                color=Fancolor.LIGHT_RED(),
-                silver_values=(1000, 4750),
-                star_value=138,
-                letter_emoji=DiscordEmoji.RARITY_LETTER_MYTHIC,
-                card_emoji=DiscordEmoji.RARITY_CARD_MYTHIC,
-                weight=WeightData(
-                    new_user=None,
-                    normal=1.25,
-                    premium=2.75
-                )
-            ),
-            self.LEGENDARY: CardRarityData(
-                index=6,
-                exclusive=False,
-                color=Fancolor.LIGHT_YELLOW(),
-                silver_values=(5000, 9750),
-                star_value=228,
-                letter_emoji=DiscordEmoji.RARITY_LETTER_LEGENDARY,
-                card_emoji=DiscordEmoji.RARITY_CARD_LEGENDARY,
-                weight=WeightData(
-                    new_user=None,
-                    normal=0.15,
-                    premium=0.75
-                )
-            ),
-            self.EXOTIC: CardRarityData(
-                index=7,
-                exclusive=False,
-                color=Fancolor.LIGHT_ORANGE(),
-                silver_values=None,
-                star_value=486,
-                letter_emoji=DiscordEmoji.RARITY_LETTER_EXOTIC,
-                card_emoji=DiscordEmoji.RARITY_CARD_EXOTIC,
-                weight=None
-            ),
-            self.NIGHTMARE: CardRarityData(
-                index=8,
-                exclusive=False,
-                color=Fancolor.BLACK(),
-                silver_values=None,
-                star_value=972,
-                letter_emoji=DiscordEmoji.RARITY_LETTER_NIGHTMARE,
-                card_emoji=DiscordEmoji.RARITY_CARD_NIGHTMARE,
-                weight=None
-            ),
-            self.ICICLE: CardRarityData(
-                index=101,
-                exclusive=True,
-                color=Fancolor.LIGHT_BLUE(),
-                silver_values=None,
-                star_value=None,
-                letter_emoji=DiscordEmoji.RARITY_LETTER_EXCLUSIVE,
-                card_emoji=DiscordEmoji.RARITY_CARD_ICICLE,
-                weight=None
+        return self._data
+
+
+def _create_data() -> dict[CardRarity, CardRarityData]:
+    return {
+        CardRarity.COMMON: CardRarityData(
+            index=1,
+            exclusive=False,
+            color=Fancolor.GRAY(),
+            silver_values=(10, 40),
+            star_value=3,
+            letter_emoji=DiscordEmoji.RARITY_LETTER_COMMON,
+            card_emoji=DiscordEmoji.RARITY_CARD_COMMON,
+            weight=WeightData(
+                new_user=65,
+                normal=46.5,
+                premium=None
+            )
+        ),
+        CardRarity.UNCOMMON: CardRarityData(
+            index=2,
+            exclusive=False,
+            color=Fancolor.LIGHT_GREEN(),
+            silver_values=(50, 75),
+            star_value=12,
+            letter_emoji=DiscordEmoji.RARITY_LETTER_UNCOMMON,
+            card_emoji=DiscordEmoji.RARITY_CARD_UNCOMMON,
+            weight=WeightData(
+                new_user=20,
+                normal=30,
+                premium=50
+            )
+        ),
+        CardRarity.RARE: CardRarityData(
+            index=3,
+            exclusive=False,
+            color=Fancolor.LIGHT_BLUE(),
+            silver_values=(100, 350),
+            star_value=33,
+            letter_emoji=DiscordEmoji.RARITY_LETTER_RARE,
+            card_emoji=DiscordEmoji.RARITY_CARD_RARE,
+            weight=WeightData(
+                new_user=10,
+                normal=16.1,
+                premium=30
+            )
+        ),
+        CardRarity.EPIC: CardRarityData(
+            index=4,
+            exclusive=False,
+            color=Fancolor.LIGHT_PURPLE(),
+            silver_values=(500, 750),
+            star_value=72,
+            letter_emoji=DiscordEmoji.RARITY_LETTER_EPIC,
+            card_emoji=DiscordEmoji.RARITY_CARD_EPIC,
+            weight=WeightData(
+                new_user=5,
+                normal=6,
+                premium=16.5
             )
-        }
-        return mapping[self]
+        ),
+        CardRarity.MYTHIC: CardRarityData(
+            index=5,
+            exclusive=False,
+            color=Fancolor.LIGHT_RED(),
+            silver_values=(1000, 4750),
+            star_value=138,
+            letter_emoji=DiscordEmoji.RARITY_LETTER_MYTHIC,
+            card_emoji=DiscordEmoji.RARITY_CARD_MYTHIC,
+            weight=WeightData(
+                new_user=None,
+                normal=1.25,
+                premium=2.75
+            )
+        ),
+        CardRarity.LEGENDARY: CardRarityData(
+            index=6,
+            exclusive=False,
+            color=Fancolor.LIGHT_YELLOW(),
+            silver_values=(5000, 9750),
+            star_value=228,
+            letter_emoji=DiscordEmoji.RARITY_LETTER_LEGENDARY,
+            card_emoji=DiscordEmoji.RARITY_CARD_LEGENDARY,
+            weight=WeightData(
+                new_user=None,
+                normal=0.15,
+                premium=0.75
+            )
+        ),
+        CardRarity.EXOTIC: CardRarityData(
+            index=7,
+            exclusive=False,
+            color=Fancolor.LIGHT_ORANGE(),
+            silver_values=None,
+            star_value=486,
+            letter_emoji=DiscordEmoji.RARITY_LETTER_EXOTIC,
+            card_emoji=DiscordEmoji.RARITY_CARD_EXOTIC,
+            weight=None
+        ),
+        CardRarity.NIGHTMARE: CardRarityData(
+            index=8,
+            exclusive=False,
+            color=Fancolor.BLACK(),
+            silver_values=None,
+            star_value=972,
+            letter_emoji=DiscordEmoji.RARITY_LETTER_NIGHTMARE,
+            card_emoji=DiscordEmoji.RARITY_CARD_NIGHTMARE,
+            weight=None
+        ),
+        CardRarity.ICICLE: CardRarityData(
+            index=101,
+            exclusive=True,
+            color=Fancolor.LIGHT_BLUE(),
+            silver_values=None,
+            star_value=None,
+            letter_emoji=DiscordEmoji.RARITY_LETTER_EXCLUSIVE,
+            card_emoji=DiscordEmoji.RARITY_CARD_ICICLE,
+            weight=None
+        )
+    }
+
+
+# the data never changes, so it is created once and stored on every member instead of on every access
+for _member, _data in _create_data().items():
+    _member._data = _data
+
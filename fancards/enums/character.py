@@ -1,13 +1,20 @@
+from __future__ import annotations
+
 import json
 import random
 from enum import Enum
+from bisect import bisect_left
+from types import MappingProxyType
 from dataclasses import dataclass
-from typing import Optional
+from typing import Mapping, Optional
 
 from .card_property import CardRarity
 
 
-__all__ = ("Character",)
+__all__ = (
+    "Character",
+    "CharacterCatalog"
+)
 
 with open("fancards/json/characters.json", "r") as file:
     characters_json = json.load(file)
@@ -22,6 +29,63 @@ class CharacterData:
     rarity: CardRarity
 
 
+@dataclass(frozen=True)
+class CharacterCatalog:
+    """Every character indexed once, since the catalog never changes while the bot runs.
+
+    Attributes
+    ----------
+    characters: tuple[:class:`CharacterData`, ...]
+        Every character in the order of :class:`Character`.
+    by_display_name: Mapping[:class:`str`, :class:`CharacterData`]
+        The characters by their display name.
+    by_reference_name: Mapping[:class:`str`, :class:`CharacterData`]
+        The characters by their reference name.
+    by_casefolded_name: Mapping[:class:`str`, :class:`CharacterData`]
+        The characters by their casefolded display name.
+    by_rarity: Mapping[:class:`CardRarity`, tuple[:class:`CharacterData`, ...]]
+        The characters of every rarity that has characters.
+    sorted_names: tuple[:class:`str`, ...]
+        The casefolded display names in alphabetical order, to look up prefixes with a bisection.
+    """
+    characters: tuple[CharacterData, ...]
+    by_display_name: Mapping[str, CharacterData]
+    by_reference_name: Mapping[str, CharacterData]
+    by_casefolded_name: Mapping[str, CharacterData]
+    by_rarity: Mapping[CardRarity, tuple[CharacterData, ...]]
+    sorted_names: tuple[str, ...]
+
+    @classmethod
+    def create(cls, character_rarities: list[list[CharacterData]]) -> CharacterCatalog:
+        """Indexes the characters of every rarity."""
+        characters = tuple(character for characters in character_rarities for character in characters)
+        return cls(
+            characters=characters,
+            by_display_name=MappingProxyType({character.display_name: character for character in characters}),
+            by_reference_name=MappingProxyType({character.reference_name: character for character in characters}),
+            by_casefolded_name=MappingProxyType({character.display_name.casefold(): character for character in characters}),
+            by_rarity=MappingProxyType({characters[0].rarity: tuple(characters) for characters in character_rarities if characters}),
+            sorted_names=tuple(sorted(character.display_name.casefold() for character in characters))
+        )
+
+    def find(self, name: str) -> Optional[CharacterData]:
+        """Returns the character whose display name matches ``name`` regardless of case, ``None`` if there is none."""
+        return self.by_casefolded_name.get(name.casefold())
+
+    def search(self, prefix: str) -> list[CharacterData]:
+        """Returns the characters whose display name begins with ``prefix`` regardless of case, in alphabetical order."""
+        prefix = prefix.casefold()
+        characters: list[CharacterData] = []
+        for index in range(bisect_left(self.sorted_names, prefix), len(self.sorted_names)):
+            name = self.sorted_names[index]
+            if not name.startswith(prefix):
+                break
+
+            characters.append(self.by_casefolded_name[name])
+
+        return characters
+
+
 class Character(Enum):
     COMMON = [
         CharacterData(
@@ -73,43 +137,48 @@ class Character(Enum):
     ]
 
     @classmethod
-    def get_all_characters(cls) -> list[CharacterData]:
-        """Gets every single character regardless of their assigned rarity."""        
-        characters: list[CharacterData] = []
-        for character_rarity in cls:
-            characters.extend(character_rarity.value)
+    def get_catalog(cls) -> CharacterCatalog:
+        """Returns the indexed catalog of every character."""
+        return _catalog
 
-        return characters
+    @classmethod
+    def get_all_characters(cls) -> tuple[CharacterData, ...]:
+        """Gets every single character regardless of their assigned rarity."""        
+        return _catalog.characters
     
     @classmethod
     def get_character_rarity(cls, name: str) -> CardRarity:
         """Returns the rarity of the character with the provided ``name``."""
-        character_mapping = {character.display_name: character.rarity for character in cls.get_all_characters()}
-        if name in character_mapping:
-            return character_mapping[name]
-            
-        raise ValueError(f"Character '{name}' does not exist.")
+        return cls.get_character_data(name).rarity
     
     @classmethod
     def get_character_data(cls, name: str) -> CharacterData:
         """Returns the data of the character with the provided ``name``."""
-        character_mapping = {character.display_name: character for character in cls.get_all_characters()}
-        if name in character_mapping:
-            return character_mapping[name]
+        character = _catalog.by_display_name.get(name)
+        if character is not None:
+            return character
             
         raise ValueError(f"Character '{name}' does not exist.")
+
+    @classmethod
+    def get_character_data_by_reference_name(cls, reference_name: str) -> CharacterData:
+        """Returns the data of the character with the provided ``reference_name``."""
+        character = _catalog.by_reference_name.get(reference_name)
+        if character is not None:
+            return character
+
+        raise ValueError(f"Character '{reference_name}' does not exist.")
     
     @classmethod
-    def get_random_character(cls, rarity: Optional[CardRarity] = None) -> CharacterData:
+    def get_random_character(cls, rarity: Optional[CardRarity] = None, rng: Optional[random.Random] = None) -> CharacterData:
         """Returns a random character assigned with the ``rarity``.
 
         Returns a random character regardless of their assigned rarity if ``rarity`` is ``None``
-        or if it is exclusive.
+        or if it is exclusive. ``rng`` is the random generator to use, the global one if ``None``.
         """
-        if rarity is None or rarity.exclusive:
-            character = random.choice(cls.get_all_characters())  # pick a random character from all rarities
-        else:
-            character: CharacterData = random.choice(getattr(cls, rarity.name).value)
+        # exclusive rarities have no characters of their own
+        characters = _catalog.characters if rarity is None else _catalog.by_rarity.get(rarity, _catalog.characters)
+        return (rng or random).choice(characters)
+
 
-        return character
-    
\ No newline at end of file
+_catalog = CharacterCatalog.create([character_rarity.value for character_rarity in Character])
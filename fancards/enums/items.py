@@ -1,13 +1,19 @@
+from __future__ import annotations
+
 import json
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass
-from typing import Optional, Self
+from typing import Any, Mapping, Optional, Self
 
 from .currency import Currency
 from .discord_emoji import DiscordEmoji
 
 
-__all__ = ("Item",)
+__all__ = (
+    "Item",
+    "ItemCatalog"
+)
 
 with open("fancards/json/items.json", "r") as file:
     item_json = json.load(file)
@@ -18,6 +24,14 @@ class ItemShopData:
     price: int
     currency: Currency
 
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Self:
+        """Parses the ``shop_data`` of an item in ``items.json``."""
+        return cls(
+            price=data["shop_price"],
+            currency=Currency[data["shop_currency"]]
+        )
+
 
 @dataclass(frozen=True)
 class ItemData:
@@ -27,11 +41,55 @@ class ItemData:
     emoji_enum_name: str
     visible: bool
     usable: bool
+    emoji: str
 
-    @property
-    def emoji(self) -> str:
-        mapping = {discord_emoji.name: discord_emoji.value for discord_emoji in DiscordEmoji}
-        return mapping[self.emoji_enum_name]
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Self:
+        """Parses an item in ``items.json``, resolving its emoji.
+
+        Raises
+        ------
+        ValueError
+            The emoji of the item does not exist.
+        """
+        emoji_enum_name = data["emoji_enum_name"]
+        if emoji_enum_name not in DiscordEmoji.__members__:
+            raise ValueError(f"Emoji '{emoji_enum_name}' of item '{data['display_name']}' does not exist.")
+
+        shop_data = data["shop_data"]
+        return cls(
+            display_name=data["display_name"],
+            description=data["description"],
+            shop_data=None if shop_data is None else ItemShopData.from_json(shop_data),
+            emoji_enum_name=emoji_enum_name,
+            visible=data["visible"],
+            usable=data["usable"],
+            emoji=DiscordEmoji[emoji_enum_name].value
+        )
+
+
+@dataclass(frozen=True)
+class ItemCatalog:
+    """Every item of ``items.json`` parsed and indexed once.
+
+    Attributes
+    ----------
+    items: tuple[:class:`ItemData`, ...]
+        Every item in the order of ``items.json``.
+    by_display_name: Mapping[:class:`str`, :class:`ItemData`]
+        The items by their display name.
+    """
+    items: tuple[ItemData, ...]
+    by_display_name: Mapping[str, ItemData]
+
+    @classmethod
+    def create(cls, data: list[dict[str, Any]]) -> ItemCatalog:
+        """Parses and indexes the items of ``items.json``."""
+        items = tuple(ItemData.from_json(item_data) for item_data in data)
+        return cls(
+            items=items,
+            by_display_name=MappingProxyType({item_data.display_name: item_data for item_data in items})
+        )
 
 
 class Item(Enum):
@@ -51,17 +109,35 @@ class Item(Enum):
         return self.value
     
     @staticmethod
-    def get_item_data_list() -> list[ItemData]:
-        return [ItemData(**data) for data in item_json["items"]]
+    def get_catalog() -> ItemCatalog:
+        """Returns the parsed catalog of every item."""
+        return _catalog
+
+    @staticmethod
+    def get_item_data_list() -> tuple[ItemData, ...]:
+        return _catalog.items
 
     @classmethod
     def get_item_data(cls, item: Self) -> ItemData:
-        for item_data in cls.get_item_data_list():
-            if item_data.display_name == item.display_name:
-                return item_data
+        return item.data
+
+    @classmethod
+    def get_item_data_by_name(cls, name: str) -> ItemData:
+        """Returns the data of the item with the display name ``name``."""
+        item_data = _catalog.by_display_name.get(name)
+        if item_data is not None:
+            return item_data
 
         raise ValueError("This item does not exist.")
+
+    @property
+    def data(self) -> ItemData:
+        return _item_data[self]
     
     def display(self) -> str:
-        item_data = self.get_item_data(self)
-        return f"{item_data.emoji} **{self.display_name.title()}**"
+        return _displays[self]
+
+
+_catalog = ItemCatalog.create(item_json["items"])
+_item_data = {item: _catalog.by_display_name[item.display_name] for item in Item}
+_displays = {item: f"{item_data.emoji} **{item.display_name.title()}**" for item, item_data in _item_data.items()}
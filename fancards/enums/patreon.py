@@ -1,10 +1,18 @@
+from __future__ import annotations
+
 from enum import Enum
+from typing import Optional
 from dataclasses import dataclass
 
 import discord
 
+from fancards.cache import LRUCache
+
 
-__all__ = ("PatreonRole",)
+__all__ = (
+    "PatreonRole",
+    "PatreonTierCache"
+)
 
 
 @dataclass(frozen=True)
@@ -45,24 +53,83 @@ class PatreonRole(Enum):
     @classmethod
     def get_role_ids(cls) -> list[int]:
         return [role.id for role in cls]
-    
-    
+
+
+# the Patreon roles by their ID, to resolve the roles of a member without scanning every tier
+_patreon_roles = {role.id: role for role in PatreonRole}
+_patreon_roles_by_tier = {role.tier: role for role in PatreonRole}
+
+PATREON_TIER_CACHE_SIZE = 10_000
+
+
+class PatreonTierCache:
+    """Caches the highest Patreon role of the most recently seen members.
+
+    Members are cached by guild and user ID, since Patreon roles are roles of a guild.
+    A cached member has to be invalidated when their roles change, e.g. in ``on_member_update``.
+
+    Parameters
+    ----------
+    maxsize: :class:`int`
+        The amount of members kept before the least recently seen one is evicted.
+    """
+    def __init__(self, maxsize: int = PATREON_TIER_CACHE_SIZE):
+        # the tier of every member, 0 if they have no Patreon role, since the cache returns None on a miss
+        self._tiers: LRUCache[tuple[int, int], int] = LRUCache(maxsize=maxsize)
+
+    def __len__(self) -> int:
+        return len(self._tiers)
+
+    @property
+    def hits(self) -> int:
+        """How many lookups were answered from the cache."""
+        return self._tiers.hits
+
+    @property
+    def misses(self) -> int:
+        """How many lookups had to resolve the roles of the member."""
+        return self._tiers.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups answered from the cache, between ``0`` and ``1``."""
+        return self._tiers.hit_rate
+
+    @staticmethod
+    def resolve(member: discord.Member) -> Optional[PatreonRole]:
+        """Returns the highest Patreon role of ``member`` without the cache, ``None`` if they have none."""
+        patreon_roles = [_patreon_roles[role.id] for role in member.roles if role.id in _patreon_roles]
+        return max(patreon_roles, key=lambda role: role.tier, default=None)
+
+    def get(self, member: discord.Member) -> Optional[PatreonRole]:
+        """Returns the highest Patreon role of ``member``, ``None`` if they have none."""
+        key = (member.guild.id, member.id)
+        tier = self._tiers.get(key)
+        if tier is None:
+            patreon_role = self.resolve(member)
+            tier = 0 if patreon_role is None else patreon_role.tier
+            self._tiers.set(key, tier)
+
+        return _patreon_roles_by_tier.get(tier)
+
+    def invalidate(self, member: discord.Member) -> None:
+        """Removes ``member`` from the cache, e.g. after their roles changed or they left the guild."""
+        self._tiers.invalidate((member.guild.id, member.id))
+
+    def clear(self) -> None:
+        """Removes every member from the cache, e.g. after role updates may have been missed."""
+        self._tiers.clear()
+
+
+patreon_tier_cache = PatreonTierCache()
+
+
 def is_patreon(member: discord.Member) -> bool:
     """Returns ``True`` if member has any Patreon roles regardless of the tier."""
-    member_role_ids = [role.id for role in member.roles]
-    return any([patreon_role_id in member_role_ids for patreon_role_id in PatreonRole.get_role_ids()])
+    return patreon_tier_cache.get(member) is not None
 
 
 def has_minimum_patreon_role(member: discord.Member, minimum_patreon_role: PatreonRole) -> bool:
     """Returns ``True`` if member has ``minimum_patreon_role`` or higher tier."""
-    patreon_role_mapping = {role.id: role for role in PatreonRole}
-    patreon_roles: list[PatreonRole] = []
-
-    for role in member.roles:
-        if role.id not in PatreonRole.get_role_ids():
-            continue
-
-        patreon_role = patreon_role_mapping[role.id]
-        patreon_roles.append(patreon_role)
-    
-    return any([patreon_role.tier >= minimum_patreon_role.tier for patreon_role in patreon_roles])
+    patreon_role = patreon_tier_cache.get(member)
+    return patreon_role is not None and patreon_role.tier >= minimum_patreon_role.tier
@@ -1 +1,10 @@
-from .card import *
\ No newline at end of file
+from .assets import *
+from .card import *
+from .card_id import *
+from .disk_cache import *
+from .drop import *
+from .drop_pool import *
+from .encoder import *
+from .layout import *
+from .renderer import *
+from .sampler import *
\ No newline at end of file
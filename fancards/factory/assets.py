@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import os
+import glob
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from PIL import Image, ImageFont
+
+from fancards.enums import CardRarity, Character
+from fancards.enums.card_property.condition import Texture
+
+
+if TYPE_CHECKING:
+    from fancards.enums.character import CharacterData
+
+__all__ = (
+    "Assets",
+    "BALOO_FONT_PATH"
+)
+
+BALOO_FONT_PATH = "assets/Baloo.ttf"
+ARROW_RIGHT_PATH = "assets/arrow_right.png"
+CARD_TEMPLATE_PATH = "assets/card_templates/{}.png"
+CHARACTER_IMAGE_PATH = "assets/character_images/{}.png"
+CHARACTERS_JSON_PATH = "fancards/json/characters.json"
+
+CARD_ID_FONT_SIZE = 17
+CHARACTER_NAME_FONT_SIZES = range(20, 50)
+
+
+def _load_image(path: str) -> Image.Image:
+    with Image.open(path) as image:
+        image.load()  # decode the pixel data now instead of on first use
+
+    return image
+
+
+def _build_texture_layer(texture: Image.Image, size: tuple[int, int], alpha: Optional[float]) -> Image.Image:
+    layer = texture.convert("RGBA").resize(size)
+    if alpha is not None:
+        transparent_image = Image.new("RGBA", size, (0, 0, 0, 0))
+        layer = Image.blend(transparent_image, layer, alpha=alpha)
+
+    return layer
+
+
+class Assets:
+    """A registry of every decoded image and font used to render cards.
+
+    Everything is loaded once by :meth:`load`, which is called at startup.
+    Accessing any asset before that loads the registry on demand.
+    """
+    _loaded = False
+    _load_lock = threading.Lock()
+    _card_templates: dict[CardRarity, Image.Image] = {}
+    _character_images: dict[str, Image.Image] = {}
+    _textures: dict[Texture, Image.Image] = {}
+    _texture_layers: dict[tuple[Texture, tuple[int, int], Optional[float]], Image.Image] = {}
+    _fonts: dict[int, ImageFont.FreeTypeFont] = {}
+    _arrow_icon: Image.Image
+    _fingerprint: Optional[str] = None
+
+    @classmethod
+    def load(cls) -> None:
+        """Decodes every card template, texture, character image and font size.
+
+        Raises
+        ------
+        FileNotFoundError
+            A character in ``characters.json`` does not have an image.
+        """
+        if cls._loaded:
+            return None
+
+        with cls._load_lock:
+            if cls._loaded:  # loaded by another thread while waiting for the lock
+                return None
+
+            missing_characters = [
+                character.display_name for character in Character.get_all_characters()
+                if not os.path.isfile(CHARACTER_IMAGE_PATH.format(character.reference_name))
+            ]
+            if missing_characters:
+                raise FileNotFoundError(f"Characters without an image: {', '.join(missing_characters)}.")
+
+            cls._card_templates = {
+                rarity: _load_image(CARD_TEMPLATE_PATH.format(rarity.name.lower())) for rarity in CardRarity
+            }
+            cls._character_images = {
+                character.reference_name: _load_image(CHARACTER_IMAGE_PATH.format(character.reference_name))
+                for character in Character.get_all_characters()
+            }
+            cls._textures = {
+                texture: _load_image(texture.get_image_path()) for texture in Texture if texture is not Texture.MINT
+            }
+            cls._fonts = {
+                size: ImageFont.truetype(BALOO_FONT_PATH, size) for size in (CARD_ID_FONT_SIZE, *CHARACTER_NAME_FONT_SIZES)
+            }
+            cls._arrow_icon = _load_image(ARROW_RIGHT_PATH)
+            cls._loaded = True
+
+    @classmethod
+    def get_fingerprint(cls) -> str:
+        """Returns a hash of every asset file and ``characters.json``.
+
+        The hash changes whenever an asset is added, removed or edited, so it can be used
+        to version anything rendered from the assets.
+        """
+        if cls._fingerprint is None:
+            paths = sorted(glob.glob("assets/**/*.*", recursive=True)) + [CHARACTERS_JSON_PATH]
+            digest = hashlib.sha256()
+            for path in paths:
+                digest.update(path.encode())
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+
+            cls._fingerprint = digest.hexdigest()
+
+        return cls._fingerprint
+
+    @classmethod
+    def get_card_template(cls, rarity: CardRarity) -> Image.Image:
+        """Returns a copy of the card template of ``rarity`` that is safe to draw on."""
+        cls.load()
+        return cls._card_templates[rarity].copy()
+
+    @classmethod
+    def get_card_size(cls, rarity: CardRarity) -> tuple[int, int]:
+        """Returns the size of the card template of ``rarity`` without copying it."""
+        cls.load()
+        return cls._card_templates[rarity].size
+
+    @classmethod
+    def get_character_image(cls, character: CharacterData) -> Image.Image:
+        """Returns the shared image of ``character``. Do not draw on it."""
+        cls.load()
+        return cls._character_images[character.reference_name]
+
+    @classmethod
+    def get_texture(cls, texture: Texture) -> Image.Image:
+        """Returns the shared image of ``texture``. Do not draw on it."""
+        cls.load()
+        return cls._textures[texture]
+
+    @classmethod
+    def get_texture_layer(cls, texture: Texture, size: tuple[int, int], alpha: Optional[float] = None) -> Image.Image:
+        """Returns ``texture`` as a ready-to-apply overlay for a card of ``size``.
+
+        The layer is converted to RGBA, resized and, if ``alpha`` is given, blended against
+        a transparent image. It is built once per key and shared afterwards. Do not draw on it.
+
+        Parameters
+        ----------
+        texture: :class:`Texture`
+            The texture to build the layer from.
+        size: tuple[:class:`int`, :class:`int`]
+            The size of the card the layer is applied to.
+        alpha: Optional[:class:`float`]
+            The opacity of the layer. The texture is used as is if ``None``.
+
+        Returns
+        -------
+        :class:`PIL.Image.Image`
+            The texture layer.
+        """
+        key = (texture, size, alpha)
+        if key not in cls._texture_layers:
+            cls._texture_layers[key] = _build_texture_layer(cls.get_texture(texture), size, alpha)
+
+        return cls._texture_layers[key]
+
+    @classmethod
+    def get_arrow_icon(cls) -> Image.Image:
+        """Returns the shared arrow icon used by condition comparisons."""
+        cls.load()
+        return cls._arrow_icon
+
+    @classmethod
+    def get_font(cls, size: int) -> ImageFont.FreeTypeFont:
+        """Returns the Baloo font with the given ``size``, loading it if it is not preloaded."""
+        cls.load()
+        if size not in cls._fonts:
+            cls._fonts[size] = ImageFont.truetype(BALOO_FONT_PATH, size)
+
+        return cls._fonts[size]
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from PIL import Image, ImageChops
+
+from .assets import Assets
+from fancards.enums import CardCondition
+from fancards.enums.card_property.condition import Texture
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, blending falls back to Pillow without it
+    np = None
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+__all__ = (
+    "HAS_NUMPY",
+    "blend_texture",
+    "blend_texture_numpy",
+    "blend_texture_pil"
+)
+
+HAS_NUMPY = np is not None
+
+_screen_layers: dict[tuple[Texture, tuple[int, int], Optional[float]], NDArray] = {}
+
+
+def _get_texture_settings(condition: CardCondition) -> tuple[Optional[Texture], Optional[float], bool]:
+    """Returns the texture of ``condition``, its opacity and whether it is alpha composited instead of screened."""
+    if condition is CardCondition.MINT:
+        return None, None, False  # 'MINT' condition does not have a texture
+
+    texture: Texture = getattr(Texture, condition.name)  # similar to Texture.CONDITION
+    if condition is CardCondition.PRISTINE:
+        return texture, None, True
+
+    elif condition is CardCondition.NEAR_MINT:
+        return texture, 0.5, False
+
+    return texture, None, False
+
+
+def _get_screen_layer(texture: Texture, size: tuple[int, int], alpha: Optional[float]) -> NDArray:
+    """Returns the inverted texture layer as ``uint16`` so that screening it is a single multiply-divide."""
+    key = (texture, size, alpha)
+    if key not in _screen_layers:
+        layer = np.asarray(Assets.get_texture_layer(texture, size, alpha), dtype=np.uint16)
+        _screen_layers[key] = 255 - layer
+
+    return _screen_layers[key]
+
+
+def blend_texture_numpy(card_image: Image.Image, condition: CardCondition, shiny: bool) -> Image.Image:
+    """Adds the condition and shiny textures to ``card_image`` on ``uint8`` arrays.
+
+    Consecutive screens are fused into one buffer of inverted channels that every
+    texture is multiplied into in place, so the card is converted to an array and back once.
+    The ``PRISTINE`` texture is alpha composited by :func:`PIL.Image.alpha_composite` afterwards,
+    which is faster than the same integer arithmetic in numpy. Requires numpy.
+
+    Parameters
+    ----------
+    card_image: :class:`PIL.Image.Image`
+        The image to add textures to.
+    condition: :class:`CardCondition`
+        The condition texture to add.
+    shiny: :class:`bool`
+        Set to ``True`` to add a shiny texture.
+
+    Returns
+    -------
+    :class:`PIL.Image.Image`
+        The image with the added textures.
+    """
+    texture, alpha, composite = _get_texture_settings(condition)
+    if not shiny and (texture is None or composite):
+        return blend_texture_pil(card_image, condition, shiny)  # nothing to screen
+
+    size = card_image.size
+    # screen(a, b) = 255 - (255 - a) * (255 - b) / 255, so the channels are kept inverted until the end
+    inverse = 255 - np.asarray(card_image.convert("RGBA"), dtype=np.uint16)
+    if shiny:
+        inverse *= _get_screen_layer(Texture.SHINY, size, 0.4)
+        inverse //= 255
+
+    if texture is not None and not composite:
+        inverse *= _get_screen_layer(texture, size, alpha)
+        inverse //= 255
+
+    card_image = Image.fromarray((255 - inverse).astype(np.uint8), "RGBA")
+    if texture is not None and composite:
+        return Image.alpha_composite(card_image, Assets.get_texture_layer(texture, size))
+
+    return card_image
+
+
+def blend_texture_pil(card_image: Image.Image, condition: CardCondition, shiny: bool) -> Image.Image:
+    """Adds the condition and shiny textures to ``card_image`` with Pillow.
+
+    Parameters
+    ----------
+    card_image: :class:`PIL.Image.Image`
+        The image to add textures to.
+    condition: :class:`CardCondition`
+        The condition texture to add.
+    shiny: :class:`bool`
+        Set to ``True`` to add a shiny texture.
+
+    Returns
+    -------
+    :class:`PIL.Image.Image`
+        The image with the added textures.
+    """
+    card_image = card_image.convert("RGBA")
+
+    if shiny:
+        texture_layer = Assets.get_texture_layer(Texture.SHINY, card_image.size, alpha=0.4)
+        card_image = ImageChops.screen(card_image, texture_layer)
+
+    texture, alpha, composite = _get_texture_settings(condition)
+    if texture is None:
+        return card_image
+
+    texture_layer = Assets.get_texture_layer(texture, card_image.size, alpha)
+    if composite:
+        return Image.alpha_composite(card_image, texture_layer)
+
+    return ImageChops.screen(card_image, texture_layer)
+
+
+def blend_texture(card_image: Image.Image, condition: CardCondition, shiny: bool) -> Image.Image:
+    """Adds the condition and shiny textures to ``card_image``, with numpy if it is installed."""
+    if HAS_NUMPY:
+        return blend_texture_numpy(card_image, condition, shiny)
+
+    return blend_texture_pil(card_image, condition, shiny)
@@ -6,15 +6,19 @@ from math import ceil
 from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass
 
-from PIL import Image, ImageDraw, ImageChops, ImageFont
+from PIL import Image, ImageDraw
 
+from .assets import Assets
+from .blending import blend_texture
+from .layout import CharacterNameLayouts
+from .sampler import DropSampler
+from fancards.cache import LRUCache
 from fancards.enums import (
     Weight,
     CardRarity,
     CardCondition,
     Character
 )
-from fancards.enums.card_property.condition import Texture
 
 
 if TYPE_CHECKING:
@@ -23,24 +27,30 @@ if TYPE_CHECKING:
 __all__ = (
     "CardFactory",
     "CardImage",
-    "CARD_ID_LENGTH"
+    "CardSpec",
+    "CARD_ID_LENGTH",
+    "THUMBNAIL_SCALE",
+    "TROLL_CARD_ID"
 )
 
-BALOO_FONT_PATH = "assets/Baloo.ttf"
 CARD_ID_LENGTH = 6
+TROLL_CARD_ID = "7R0115"  # troll cards are never stored, so they all share this ID
+BASE_IMAGE_CACHE_SIZE = 128
+RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+THUMBNAIL_SCALE = 0.25  # embed thumbnails are displayed at roughly a quarter of the card size
+CARD_ID_FONT_SIZE = 17
+MIN_CARD_ID_FONT_SIZE = 10  # smaller IDs are unreadable, e.g. on thumbnails whose embed shows the ID as text
 
 
-def _random_number() -> float:
-    return random.random() * 100
+def _image_nbytes(image: Image.Image) -> int:
+    return image.width * image.height * len(image.getbands())
 
 
-def _convert_resize_texture(card_image: Image.Image, texture: Image.Image) -> Image.Image:
-    texture = texture.convert("RGBA")
-    texture = texture.resize(card_image.size)
-    return texture
+def _scale_size(size: tuple[int, int], scale: float) -> tuple[int, int]:
+    return max(round(size[0] * scale), 1), max(round(size[1] * scale), 1)
 
 
-def _generate_card(
+def _draw_card(
     *,
     card_id: Optional[str],
     rarity: Optional[CardRarity],
@@ -49,45 +59,91 @@ def _generate_card(
     weight: Optional[Weight],
     shiny: bool,
     patreon: bool,
-    show_card_id: bool,
-    show_card_condition: bool,
-    show_card_character_image: bool
-) -> CardImage:
-    card_rarity = rarity or CardFactory.get_card_rarity(weight)
-    card_image = Image.open(f"assets/card_templates/{card_rarity.name.lower()}.png")
-    card_condition = condition or CardFactory.get_card_condition(weight)
-    is_shiny = shiny or CardFactory.get_shiny(weight, patreon)
-    card_id = card_id or CardFactory.generate_card_id()
+    rng: Optional[random.Random] = None
+) -> tuple[CardSpec, CharacterData]:
+    sampler = DropSampler.get(weight)
+    card_rarity = rarity or sampler.draw_rarity(rng)
+    card_condition = condition or sampler.draw_condition(rng)
+    is_shiny = shiny or sampler.draw_shiny(patreon, rng)
+    card_id = card_id or CardFactory.generate_card_id(rng)
 
     if character_name is None:
-        character = Character.get_random_character(card_rarity)
+        character = Character.get_random_character(card_rarity, rng)
     else:
         character = Character.get_character_data(character_name)
 
     if character.display_name == "Troll":
-        card_id = "7R0115"
+        card_id = TROLL_CARD_ID
 
-    if show_card_id:
-        card_image = CardFactory.add_card_id(card_image, card_id)
+    spec = CardSpec(
+        card_id=card_id,
+        rarity=card_rarity,
+        condition=card_condition,
+        character_name=character.display_name,
+        is_shiny=is_shiny
+    )
+    return spec, character
+
+
+def _generate_card(
+    *,
+    card_id: Optional[str],
+    rarity: Optional[CardRarity],
+    condition: Optional[CardCondition],
+    character_name: Optional[str],
+    weight: Optional[Weight],
+    shiny: bool,
+    patreon: bool,
+    show_card_id: bool,
+    show_card_condition: bool,
+    show_card_character_image: bool
+) -> CardImage:
+    spec, character = _draw_card(
+        card_id=card_id,
+        rarity=rarity,
+        condition=condition,
+        character_name=character_name,
+        weight=weight,
+        shiny=shiny,
+        patreon=patreon
+    )
 
     if show_card_character_image:
-        card_image = CardFactory.add_character_image(card_image, character)
+        card_image = CardFactory.get_base_image(spec.rarity, character)
+    else:
+        card_image = Assets.get_card_template(spec.rarity)
+
+    if show_card_id:
+        card_image = CardFactory.add_card_id(card_image, spec.card_id)
 
     if show_card_condition:
-        card_image = CardFactory.add_texture(card_image, card_condition, is_shiny)
+        card_image = CardFactory.add_texture(card_image, spec.condition, spec.is_shiny)
 
     card = CardImage(
         image=card_image,
-        rarity=card_rarity,
-        condition=card_condition,
+        rarity=spec.rarity,
+        condition=spec.condition,
         character=character,
-        card_id=card_id,
-        is_shiny=is_shiny
+        card_id=spec.card_id,
+        is_shiny=spec.is_shiny
     )
 
     return card
 
 
+@dataclass(frozen=True, slots=True)
+class CardSpec:
+    """Everything that determines how a stored card looks.
+
+    Specs are slotted since every live drop and cached render keeps them around.
+    """
+    card_id: str
+    rarity: CardRarity
+    condition: CardCondition
+    character_name: str
+    is_shiny: bool
+
+
 @dataclass
 class CardImage:
     image: Image.Image
@@ -99,6 +155,9 @@ class CardImage:
 
 
 class CardFactory:
+    base_image_cache: LRUCache[tuple[CardRarity, str, float], Image.Image] = LRUCache(maxsize=BASE_IMAGE_CACHE_SIZE)
+    render_cache: LRUCache[tuple[CardSpec, float], Image.Image] = LRUCache(max_bytes=RENDER_CACHE_MAX_BYTES, sizeof=_image_nbytes)
+
     @staticmethod
     def get_card_rarity(weight: Optional[Weight] = None) -> CardRarity:
         """Gets a random :class:`CardRarity` based on the given ``weight``.
@@ -113,27 +172,7 @@ class CardFactory:
         :class:`CardRarity`
             The rarest rarity if possible, otherwise the most common rarity of the list of options.
         """
-        weight = weight or Weight.NORMAL
-        random_number = _random_number()
-        rarities = CardRarity.get_non_exclusive_rarities()
-
-        possible_rarities: list[CardRarity] = []
-        for rarity in rarities:
-            if rarity.weight is None:
-                continue
-
-            rarity_weight: Optional[float] = getattr(rarity.weight, weight.name.lower())  # similar to rarity.weight.normal
-            if rarity_weight is not None and random_number <= rarity_weight :
-                possible_rarities.append(rarity)
-
-        if len(possible_rarities) > 0:
-            return max(possible_rarities, key=lambda r: r.index)  # return the rarest rarity
-        
-        # return the most common rarity of that specific weight
-        return max(
-            [rarity for rarity in rarities if rarity.weight is not None],
-            key=lambda r: getattr(r.weight, weight.name.lower()) or -1
-        )
+        return DropSampler.get(weight).draw_rarity()
 
     @staticmethod
     def get_card_condition(weight: Optional[Weight] = None) -> CardCondition:
@@ -149,35 +188,11 @@ class CardFactory:
         :class:`CardCondition`
             A random condition if possible, otherwise ``CardCondition.GOOD``.
         """
-        weight = weight or Weight.NORMAL
-        random_number = _random_number()
-        conditions = [condition for condition in CardCondition]
-
-        possible_conditions: list[CardCondition] = []
-        for condition in conditions:
-            condition_weight: Optional[float] = getattr(condition.weight, weight.name.lower())  # similar to condition.weight.new_user
-            if condition_weight is not None and random_number <= condition_weight:
-                possible_conditions.append(condition)
-
-        if len(possible_conditions) > 0:
-            return random.choice(possible_conditions)
-        
-        return CardCondition.GOOD  # return 'GOOD' if the random number is too high
+        return DropSampler.get(weight).draw_condition()
     
     @staticmethod
     def get_shiny_weight(weight: Weight, patreon: bool) -> float:
-        match weight:
-            case Weight.NEW_USER:
-                shiny_weight = -1  # no shiny for new users
-            case Weight.NORMAL:
-                shiny_weight = 0.05
-            case Weight.PREMIUM:
-                shiny_weight = 0.2
-
-        if patreon:
-            shiny_weight *= 2
-
-        return shiny_weight
+        return DropSampler.get(weight).get_shiny_weight(patreon)
 
     @classmethod
     def get_shiny(cls, weight: Optional[Weight] = None, patreon: bool = False) -> bool:
@@ -195,10 +210,7 @@ class CardFactory:
         :class:`bool`
             The shiny state.
         """
-        weight = weight or Weight.NORMAL
-        random_number = _random_number()
-        shiny_weight = cls.get_shiny_weight(weight, patreon)
-        return random_number <= shiny_weight
+        return DropSampler.get(weight).draw_shiny(patreon)
     
     @classmethod
     def generate_card(
@@ -306,17 +318,134 @@ class CardFactory:
             cards.append(card)
         return cards
 
+    @classmethod
+    def render_card(cls, spec: CardSpec, scale: float = 1.0) -> Image.Image:
+        """Renders a stored card, reusing the previous render of the same ``spec`` and ``scale`` if it is cached.
+        
+        Parameters
+        ----------
+        spec: :class:`CardSpec`
+            The properties of the card.
+        scale: :class:`float`
+            The size of the render relative to the full card, e.g. :data:`THUMBNAIL_SCALE`.
+        
+        Returns
+        -------
+        :class:`PIL.Image.Image`
+            A copy of the rendered card that is safe to draw on.
+        """
+        key = (spec, scale)
+        card_image = cls.render_cache.get(key)
+        if card_image is None:
+            card_image = cls.reveal_card(spec, scale)
+            cls.render_cache.set(key, card_image)
+
+        return card_image.copy()
+
+    @classmethod
+    def reveal_card(cls, spec: CardSpec, scale: float = 1.0) -> Image.Image:
+        """Reveals a card by overlaying only its ID and condition/shiny texture on its cached base layer.
+
+        The base layer is the same image a drop shows before the card is grabbed,
+        so revealing a dropped card never renders the template, character image or name again.
+
+        Parameters
+        ----------
+        spec: :class:`CardSpec`
+            The properties of the card.
+        scale: :class:`float`
+            The size of the card relative to the full card. The ID and textures
+            are drawn at that size on top of a downscaled base layer, the ID is
+            left out if it would be too small to read.
+
+        Returns
+        -------
+        :class:`PIL.Image.Image`
+            The revealed card.
+        """
+        character = Character.get_character_data(spec.character_name)
+        card_image = cls.get_base_image(spec.rarity, character, scale=scale)
+        card_image = cls.add_card_id(card_image, spec.card_id, scale)
+        return cls.add_texture(card_image, spec.condition, spec.is_shiny)
+
+    @classmethod
+    def invalidate_cards(cls, card_ids: list[str]) -> None:
+        """Removes every cached render of the cards with ``card_ids``, e.g. after their condition changed or they got burned."""
+        invalid_card_ids = set(card_ids)
+        cls.render_cache.invalidate_if(lambda key: key[0].card_id in invalid_card_ids)
+
+    @classmethod
+    def draw_cards(
+        cls,
+        *,
+        amount: int = 3,
+        weight: Optional[Weight] = None,
+        patreon: bool = False,
+        card_ids: Optional[list[str]] = None,
+        rng: Optional[random.Random] = None
+    ) -> list[CardSpec]:
+        """Draws the properties of a specified ``amount`` of random cards without rendering them.
+        
+        Parameters
+        ----------
+        amount: :class:`int`
+            The amount of cards to draw.
+        weight: Optional[:class:`Weight`]
+            The weight type to use for the rarity, condition and shiny state.
+            Defaults to ``Weight.NORMAL``
+        patreon: :class:`bool`
+            Doubles the shiny chance if ``True``.
+        card_ids: Optional[list[:class:`str`]]
+            The card IDs of the cards, e.g. from a :class:`CardIdAllocator`.
+            Random card IDs are generated if ``None``.
+        rng: Optional[:class:`random.Random`]
+            The random generator to draw with, e.g. a seeded one. Defaults to the global generator.
+        
+        Raises
+        ------
+        ValueError
+            ``card_ids`` does not contain ``amount`` card IDs.
+
+        Returns
+        -------
+        list[:class:`CardSpec`]
+            The drawn cards.
+        """
+        if card_ids is not None and len(card_ids) != amount:
+            raise ValueError(f"Expected {amount} card IDs, got {len(card_ids)}.")
+
+        return [
+            _draw_card(
+                card_id=None if card_ids is None else card_ids[index],
+                rarity=None,
+                condition=None,
+                character_name=None,
+                weight=weight,
+                shiny=False,
+                patreon=patreon,
+                rng=rng
+            )[0] for index in range(amount)
+        ]
+
     @staticmethod
-    def generate_card_id() -> str:
+    def generate_card_id(rng: Optional[random.Random] = None) -> str:
         """Generates a random six-letter card ID. 
+
+        Random card IDs are not checked for collisions with stored cards,
+        cards that are stored should get theirs from a :class:`CardIdAllocator`.
+        
+        Parameters
+        ----------
+        rng: Optional[:class:`random.Random`]
+            The random generator to use. Defaults to the global generator.
         
         Returns
         -------
         :class:`str`
             The generated card ID.
         """
-        card_id = string.digits + string.ascii_lowercase + string.digits
-        return "".join(random.choices(card_id, k=CARD_ID_LENGTH))
+        card_id = string.digits + string.ascii_lowercase
+        return "".join((rng or random).choices(card_id, k=CARD_ID_LENGTH))
 
     @staticmethod
     def add_texture(card_image: Image.Image, condition: CardCondition, shiny: bool) -> Image.Image:
@@ -336,35 +465,11 @@ class CardFactory:
         :class:`PIL.Image.Image`
             The image with the added textures.
         """
-        card_image = card_image.convert("RGBA")
-        transparent_image = Image.new("RGBA", card_image.size, (0, 0, 0, 0))
-        
-        if shiny:
-            texture = Image.open(Texture.SHINY.get_image_path())
-            texture = _convert_resize_texture(card_image, texture)
-            texture = Image.blend(transparent_image, texture, alpha=0.4)
-            card_image = ImageChops.screen(card_image, texture)
-
-        if condition is CardCondition.MINT:
-            return card_image  # 'MINT' condition does not have a texture
-        
-        texture = Image.open(getattr(Texture, condition.name).get_image_path())  # similar to Image.open(Texture.CONDITION.get_image_path())
-        if condition is CardCondition.PRISTINE:
-            texture = _convert_resize_texture(card_image, texture)
-            return Image.alpha_composite(card_image, texture)
-        
-        elif condition is CardCondition.NEAR_MINT:
-            texture = _convert_resize_texture(card_image, texture)
-            texture = Image.blend(transparent_image, texture, alpha=0.5)
-            return ImageChops.screen(card_image, texture)
+        return blend_texture(card_image, condition, shiny)
 
-        else:
-            texture = _convert_resize_texture(card_image, texture)
-            return ImageChops.screen(card_image, texture)
-        
     @staticmethod
-    def add_card_id(card_image: Image.Image, card_id: str) -> Image.Image:
-        """Adds ``card_id`` as text to ``card_image``.
+    def add_card_id(card_image: Image.Image, card_id: str, scale: float = 1.0) -> Image.Image:
+        """Adds ``card_id`` as text to ``card_image``, unless it would be too small to read at ``scale``.
         
         Parameters
         ----------
@@ -372,15 +477,21 @@ class CardFactory:
             The image to add the text on.
         card_id: :class:`str`
             The text to add.
+        scale: :class:`float`
+            The size of ``card_image`` relative to the full card.
         
         Returns
         -------
         :class:`PIL.Image.Image`
             The image with the added text.
         """
-        font = ImageFont.truetype(BALOO_FONT_PATH, 17)
+        font_size = round(CARD_ID_FONT_SIZE * scale)
+        if font_size < MIN_CARD_ID_FONT_SIZE:
+            return card_image
+
+        font = Assets.get_font(font_size)
         draw = ImageDraw.Draw(card_image)
-        draw.text((37, 510), f"#{card_id}", font=font)  # type: ignore
+        draw.text((round(37 * scale), round(510 * scale)), f"#{card_id}", font=font)  # type: ignore
         return card_image
 
     @staticmethod
@@ -399,26 +510,9 @@ class CardFactory:
         :class:`PIL.Image.Image`
             The image with the added text.
         """
-        bound_width = 285
-        bound_height = 50
-        font_size = 49
-
+        layout = CharacterNameLayouts.get(character_name, card_image.width)
         draw = ImageDraw.Draw(card_image)
-        font = ImageFont.truetype(BALOO_FONT_PATH, font_size)
-        width, height = draw.multiline_textsize(character_name, font=font)
-
-        while width > bound_width:
-            font_size -= 1
-            font = ImageFont.truetype(BALOO_FONT_PATH, font_size)
-            width, height = draw.textbbox((0, 0), character_name, font=font)[2:]
-
-        x = (card_image.width - width) / 2
-        y = (900 - height) / 2 + 5
-
-        if height > bound_height:
-            y -= 5
-
-        draw.multiline_text((x, y), character_name, font=font)
+        draw.multiline_text(layout.position, character_name, font=Assets.get_font(layout.font_size))
         return card_image
 
     @classmethod
@@ -437,11 +531,54 @@ class CardFactory:
         :class:`PIL.Image.Image`
             The image with the character image pasted.
         """
-        character_image = Image.open(f"assets/character_images/{character.reference_name}.png")
+        character_image = Assets.get_character_image(character)
         card_image = cls.add_character_name(card_image, character.display_name)
         card_image.paste(character_image, (0, 0), mask=character_image)
         return card_image
 
+    @classmethod
+    def get_base_image(
+        cls,
+        rarity: CardRarity,
+        character: CharacterData,
+        copy: bool = True,
+        scale: float = 1.0
+    ) -> Image.Image:
+        """Gets the base layer of a card; the template of ``rarity`` with the image and name of ``character``.
+
+        Base layers are cached by ``(rarity, character, scale)`` since only the card ID and
+        condition layers differ between cards.
+        
+        Parameters
+        ----------
+        rarity: :class:`CardRarity`
+            The rarity of the card template.
+        character: :class:`CharacterData`
+            The data of the character.
+        copy: :class:`bool`
+            Set to ``False`` to get the cached image itself, e.g. to paste it somewhere. Do not draw on it.
+        scale: :class:`float`
+            The size of the base layer relative to the full card. Scaled base layers
+            are downscaled once from the full one.
+        
+        Returns
+        -------
+        :class:`PIL.Image.Image`
+            The base layer, copied unless ``copy`` is ``False``.
+        """
+        key = (rarity, character.display_name, scale)
+        base_image = cls.base_image_cache.get(key)
+        if base_image is None:
+            if scale == 1.0:
+                base_image = cls.add_character_image(Assets.get_card_template(rarity), character)
+            else:
+                full_image = cls.get_base_image(rarity, character, copy=False)
+                base_image = full_image.resize(_scale_size(full_image.size, scale), Image.LANCZOS)
+
+            cls.base_image_cache.set(key, base_image)
+
+        return base_image.copy() if copy else base_image
+
     @staticmethod
     def align_card_images(
         card_images: list[Image.Image],
@@ -505,11 +642,7 @@ class CardFactory:
             The upgraded condition.
             The original condition is returned if its index is the highest of all.
         """
-        if condition == max(CardCondition):
-            return condition
-        
-        condition_mapping = {condition.index: condition for condition in CardCondition}
-        return condition_mapping[condition.index + 1]
+        return condition.get_upgrade()
 
     @staticmethod
     def downgrade_condition(condition: CardCondition) -> CardCondition:
@@ -526,11 +659,7 @@ class CardFactory:
             The downgraded condition.
             The original condition is returned if its index is the lowest of all.
         """
-        if condition == min(CardCondition):
-            return condition
-        
-        condition_mapping = {condition.index: condition for condition in CardCondition}
-        return condition_mapping[condition.index - 1]
+        return condition.get_downgrade()
 
     @classmethod
     def condition_comparison(cls, card: CardImage, old_condition: CardCondition, new_condition: CardCondition) -> Image.Image:
@@ -553,7 +682,7 @@ class CardFactory:
         card_image = card.image
         original_image = cls.add_texture(card_image, old_condition, card.is_shiny)
         upgraded_card_image = cls.add_texture(card_image, new_condition, card.is_shiny)
-        arrow_icon = Image.open("assets/arrow_right.png")
+        arrow_icon = Assets.get_arrow_icon()
 
         pixel_offset = 120
         width = original_image.width + upgraded_card_image.width + pixel_offset
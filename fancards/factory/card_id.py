@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import string
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Optional
+
+from .card import CARD_ID_LENGTH, TROLL_CARD_ID
+
+
+if TYPE_CHECKING:
+    from asyncpg import Pool, Record
+    from .card import CardSpec
+
+__all__ = (
+    "CardIdAllocator",
+    "CardIdUsage",
+    "CARD_ID_ALPHABET",
+    "CARD_ID_SPACE"
+)
+
+log = logging.getLogger(__name__)
+
+CARD_ID_ALPHABET = string.digits + string.ascii_lowercase
+CARD_ID_SPACE = len(CARD_ID_ALPHABET) ** CARD_ID_LENGTH
+
+# a card ID is split into two halves of three characters, which are the two sides of the Feistel network
+HALF_SPACE = len(CARD_ID_ALPHABET) ** (CARD_ID_LENGTH // 2)
+FEISTEL_KEYS = (0x5BD1E995, 0x27D4EB2F, 0x165667B1, 0x9E3779B1)
+
+
+def _round_function(value: int, key: int) -> int:
+    mixed = ((value ^ key) * 0x45D9F3B) & 0xFFFFFFFF
+    mixed ^= mixed >> 16
+    return mixed % HALF_SPACE
+
+
+def _encode(number: int) -> str:
+    characters: list[str] = []
+    for _ in range(CARD_ID_LENGTH):
+        number, index = divmod(number, len(CARD_ID_ALPHABET))
+        characters.append(CARD_ID_ALPHABET[index])
+
+    return "".join(reversed(characters))
+
+
+@dataclass(frozen=True)
+class CardIdUsage:
+    """How much of the card ID space is used.
+
+    Attributes
+    ----------
+    allocated: :class:`int`
+        How many card IDs were reserved so far, including unused ones of reserved blocks.
+    stored: :class:`int`
+        How many cards are stored in ``user_data.card``.
+    capacity: :class:`int`
+        The amount of possible card IDs.
+    """
+    allocated: int
+    stored: int
+    capacity: int
+
+    @property
+    def allocated_percent(self) -> float:
+        """The reserved share of the card ID space in percent."""
+        return self.allocated / self.capacity * 100
+
+    @property
+    def stored_percent(self) -> float:
+        """The stored share of the card ID space in percent."""
+        return self.stored / self.capacity * 100
+
+
+class CardIdAllocator:
+    """Hands out unique card IDs from blocks reserved in the database.
+
+    Every card ID is a number of the ``user_data.card_id_seq`` sequence, scrambled by
+    a bijective Feistel network over the six-character space so that consecutive cards
+    do not get consecutive IDs. Since the scramble is a permutation, every sequence number
+    maps to a different card ID and the space is only used up after all of it was handed out.
+
+    Blocks of sequence numbers are reserved with a single query and kept in memory, so
+    allocating an ID only waits on the database when the block runs empty. IDs that are
+    already stored, e.g. randomly generated ones from before the allocator, are skipped.
+    IDs that are handed out but never stored, e.g. of cards nobody grabbed, are not reused;
+    the space is large enough to lose them.
+
+    Parameters
+    ----------
+    block_size: :class:`int`
+        The amount of sequence numbers reserved at once.
+    low_water: Optional[:class:`int`]
+        The next block is reserved in the background once fewer IDs are left.
+        Defaults to a quarter of ``block_size``.
+    """
+    def __init__(self, *, block_size: int = 256, low_water: Optional[int] = None):
+        if block_size <= 0:
+            raise ValueError("block_size must be greater than 0.")
+
+        self.block_size = block_size
+        self.low_water = block_size // 4 if low_water is None else low_water
+        self.pool: Optional[Pool[Record]] = None
+        self._card_ids: deque[str] = deque()
+        self._lock = asyncio.Lock()
+        self._refill_task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def remaining(self) -> int:
+        """The amount of card IDs left in memory."""
+        return len(self._card_ids)
+
+    @staticmethod
+    def scramble(number: int) -> str:
+        """Maps a sequence number onto its card ID.
+
+        Parameters
+        ----------
+        number: :class:`int`
+            The sequence number, between ``0`` and ``CARD_ID_SPACE - 1``.
+
+        Raises
+        ------
+        ValueError
+            The number is outside of the card ID space.
+
+        Returns
+        -------
+        :class:`str`
+            The card ID.
+        """
+        if not 0 <= number < CARD_ID_SPACE:
+            raise ValueError(f"{number} is outside of the card ID space.")
+
+        left, right = divmod(number, HALF_SPACE)
+        for key in FEISTEL_KEYS:
+            left, right = right, (left + _round_function(right, key)) % HALF_SPACE
+
+        return _encode(left * HALF_SPACE + right)
+
+    async def open(self, pool: Pool[Record]) -> None:
+        """Binds the allocator to the database and reserves the first block."""
+        self.pool = pool
+        await self._reserve(self.block_size)
+
+    async def allocate(self, amount: int = 1) -> list[str]:
+        """Takes ``amount`` unique card IDs.
+
+        Parameters
+        ----------
+        amount: :class:`int`
+            The amount of card IDs.
+
+        Raises
+        ------
+        RuntimeError
+            The allocator is not bound to a database yet.
+
+        Returns
+        -------
+        list[:class:`str`]
+            The card IDs.
+        """
+        while len(self._card_ids) < amount:
+            await self._reserve(amount)
+
+        card_ids = [self._card_ids.popleft() for _ in range(amount)]
+        if len(self._card_ids) < self.low_water and (self._refill_task is None or self._refill_task.done()):
+            self._refill_task = asyncio.create_task(self._refill())
+
+        return card_ids
+
+    async def assign(self, cards: list[CardSpec]) -> list[CardSpec]:
+        """Gives every card but troll cards an allocated card ID.
+
+        Parameters
+        ----------
+        cards: list[:class:`CardSpec`]
+            The cards, e.g. of a drop that is about to be sent.
+
+        Returns
+        -------
+        list[:class:`CardSpec`]
+            The cards with their new card IDs, in the same order.
+        """
+        card_ids = iter(await self.allocate(sum(card.card_id != TROLL_CARD_ID for card in cards)))
+        return [card if card.card_id == TROLL_CARD_ID else replace(card, card_id=next(card_ids)) for card in cards]
+
+    async def get_usage(self) -> CardIdUsage:
+        """Returns how much of the card ID space is used."""
+        pool = self._get_pool()
+        async with pool.acquire() as connection:
+            sequence = await connection.fetchrow("SELECT last_value, is_called FROM user_data.card_id_seq;")
+            stored = await connection.fetchval("SELECT COUNT(*) FROM user_data.card;")
+
+        assert sequence is not None
+        allocated = sequence["last_value"] if sequence["is_called"] else 0
+        return CardIdUsage(allocated=allocated, stored=stored, capacity=CARD_ID_SPACE)
+
+    def _get_pool(self) -> Pool[Record]:
+        if self.pool is None:
+            raise RuntimeError("The card ID allocator is not bound to a database yet.")
+
+        return self.pool
+
+    async def _refill(self) -> None:
+        try:
+            await self._reserve(self.low_water)
+        except Exception:
+            log.exception("Failed to reserve a block of card IDs.")
+
+    async def _reserve(self, needed: int) -> None:
+        """Reserves the next block of sequence numbers unless at least ``needed`` card IDs are left.
+
+        Only the card IDs that are not stored yet are kept.
+        """
+        pool = self._get_pool()
+        async with self._lock:
+            if len(self._card_ids) >= needed:  # another caller reserved a block in the meantime
+                return
+
+            query = """
+            SELECT nextval('user_data.card_id_seq') - 1 FROM generate_series(1, $1);
+            """
+            async with pool.acquire() as connection:
+                numbers = await connection.fetch(query, self.block_size)
+                card_ids = [self.scramble(number) for number, in numbers]
+                stored = await connection.fetch(
+                    "SELECT card_id FROM user_data.card WHERE card_id = ANY($1::TEXT[]);",
+                    card_ids
+                )
+
+            stored_card_ids = {card_id for card_id, in stored}
+            self._card_ids.extend(card_id for card_id in card_ids if card_id not in stored_card_ids)
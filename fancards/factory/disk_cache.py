@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import os
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows, the index is then only guarded per process
+    fcntl = None
+
+from .assets import Assets
+
+
+if TYPE_CHECKING:
+    from .card import CardSpec
+    from .encoder import ImageEncoder
+
+__all__ = ("DiskRenderCache",)
+
+# bump this whenever the rendering code changes how a card looks
+RENDER_VERSION = 2
+
+# the lock file and the shared size index, dotfiles are skipped when the cached files are listed
+LOCK_FILENAME = ".lock"
+SIZE_FILENAME = ".size"
+
+
+class DiskRenderCache:
+    """A content-addressed cache of encoded card images on disk.
+
+    Files are named after a hash of the card spec, the image encoder and the asset
+    fingerprint, so a changed asset never serves a stale card. Writes are atomic, so
+    several bot processes on one host can share the same ``directory``.
+
+    The total size of the directory is kept in a small index file that every process
+    updates under a lock file, so ``max_bytes`` holds for all processes together. Reads
+    touch the modification time of a file, so eviction removes the files that were least
+    recently used by any process. Eviction lists the directory again and writes the exact
+    size back to the index, which corrects any drift, e.g. from a crash mid-write.
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        The directory the cached files are stored in.
+    max_bytes: :class:`int`
+        The total size the cache is trimmed to, least recently used files first.
+    """
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._locked():
+            if self._read_size() is None:
+                self._write_size(sum(size for _, _, size in self._scan()))
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the cached files of every process, as stored in the index."""
+        return self._read_size() or 0
+
+    def get_key(self, spec: CardSpec, encoder: ImageEncoder, scale: float = 1.0) -> str:
+        """Returns the hash that addresses the cached file of ``spec`` rendered at ``scale`` and encoded with ``encoder``."""
+        key = ":".join((
+            str(RENDER_VERSION),
+            Assets.get_fingerprint(),
+            spec.card_id,
+            spec.rarity.name,
+            spec.condition.name,
+            spec.character_name,
+            str(spec.is_shiny),
+            encoder.name,
+            str(scale)
+        ))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, spec: CardSpec, encoder: ImageEncoder, scale: float = 1.0) -> Optional[bytes]:
+        """Returns the cached bytes of ``spec`` rendered at ``scale`` and encoded with ``encoder``; ``None`` if they are not cached."""
+        path = self._get_path(self.get_key(spec, encoder, scale))
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+
+            os.utime(path)  # mark as recently used for every process
+        except FileNotFoundError:  # never cached or evicted by another process
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def set(self, spec: CardSpec, encoder: ImageEncoder, data: bytes, scale: float = 1.0) -> None:
+        """Atomically stores ``data`` as the encoded image of ``spec`` at ``scale``, then evicts old files if the cache is full."""
+        path = self._get_path(self.get_key(spec, encoder, scale))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+
+            with self._locked():
+                try:
+                    old_size = os.stat(path).st_size  # overwriting a file only adds the difference
+                except FileNotFoundError:
+                    old_size = 0
+
+                os.replace(temp_path, path)  # readers see either no file or the whole file
+                nbytes = self._read_size()
+                if nbytes is None:
+                    nbytes = sum(size for _, _, size in self._scan())
+                else:
+                    nbytes += len(data) - old_size
+
+                if nbytes > self.max_bytes:
+                    nbytes = self._evict()
+
+                self._write_size(nbytes)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def evict(self) -> None:
+        """Deletes the least recently used files until the cache is below 90% of ``max_bytes``."""
+        with self._locked():
+            self._write_size(self._evict())
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Holds the lock file, and a thread lock where there is no ``fcntl``, while the index is read and written."""
+        with self._lock, open(os.path.join(self.directory, LOCK_FILENAME), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)  # released when the file is closed
+
+            yield
+
+    def _evict(self) -> int:
+        """Deletes the least recently used files of every process and returns the remaining size. Needs the lock."""
+        entries = sorted(self._scan())  # oldest first
+        nbytes = sum(size for _, _, size in entries)
+        target = int(self.max_bytes * 0.9)
+
+        for _, path, size in entries:
+            if nbytes <= target:
+                break
+
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+            nbytes -= size
+
+        return nbytes
+
+    def _read_size(self) -> Optional[int]:
+        try:
+            with open(os.path.join(self.directory, SIZE_FILENAME), "r") as file:
+                return int(file.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_size(self, nbytes: int) -> None:
+        """Replaces the index atomically, so it can be read without the lock. Needs the lock."""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            file.write(str(nbytes))
+
+        os.replace(temp_path, os.path.join(self.directory, SIZE_FILENAME))
+
+    def _scan(self) -> list[tuple[float, str, int]]:
+        entries: list[tuple[float, str, int]] = []
+        for root, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if filename.startswith(".") or filename.endswith(".tmp"):
+                    continue
+
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+
+                entries.append((stat.st_mtime, path, stat.st_size))
+
+        return entries
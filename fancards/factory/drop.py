@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from math import ceil
+from functools import lru_cache
+from dataclasses import dataclass
+
+from PIL import Image
+
+from .assets import Assets
+from .card import CardFactory, CardSpec
+from fancards.enums import Character
+
+
+__all__ = (
+    "DropLayout",
+    "DropCollage"
+)
+
+
+@dataclass(frozen=True)
+class DropLayout:
+    """The geometry of a drop collage; the canvas size and the top-left corner of every card slot."""
+    size: tuple[int, int]
+    slots: tuple[tuple[int, int], ...]
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get(
+        amount: int,
+        card_size: tuple[int, int],
+        cards_per_row: int = 3,
+        pixel_offset: int = 30
+    ) -> DropLayout:
+        """Gets the layout of ``amount`` cards, the same one :meth:`CardFactory.align_card_images` produces.
+
+        Parameters
+        ----------
+        amount: :class:`int`
+            The amount of cards in the drop.
+        card_size: tuple[:class:`int`, :class:`int`]
+            The size of the largest card.
+        cards_per_row: :class:`int`
+            How many cards to align per row.
+        pixel_offset: :class:`int`
+            The amount of offset in pixels. (The gap between images)
+
+        Returns
+        -------
+        :class:`DropLayout`
+            The layout, computed once per set of arguments.
+        """
+        width = card_size[0] + pixel_offset
+        height = card_size[1] + pixel_offset
+        columns = min(amount, cards_per_row)
+        rows = ceil(amount / cards_per_row)
+
+        slots = tuple((width * (index % cards_per_row), height * (index // cards_per_row)) for index in range(amount))
+        return DropLayout(size=(width * columns, height * rows), slots=slots)
+
+    def new_canvas(self) -> Image.Image:
+        return Image.new("RGBA", self.size, (0, 0, 0, 0))
+
+
+class DropCollage:
+    """Renders unrevealed drop cards straight into their slot of a single collage canvas."""
+
+    @staticmethod
+    def get_layout(cards: list[CardSpec], cards_per_row: int = 3) -> DropLayout:
+        """Gets the layout for ``cards``."""
+        sizes = [Assets.get_card_size(card.rarity) for card in cards]
+        card_size = (max(size[0] for size in sizes), max(size[1] for size in sizes))
+        return DropLayout.get(len(cards), card_size, cards_per_row)
+
+    @staticmethod
+    def render_slot(canvas: Image.Image, layout: DropLayout, index: int, card: CardSpec) -> None:
+        """Renders the unrevealed ``card`` into slot ``index`` of ``canvas``."""
+        character = Character.get_character_data(card.character_name)
+        base_image = CardFactory.get_base_image(card.rarity, character, copy=False)
+        canvas.paste(base_image, layout.slots[index])
+
+    @classmethod
+    def render(cls, cards: list[CardSpec], cards_per_row: int = 3) -> Image.Image:
+        """Renders the collage of the unrevealed ``cards`` one slot after another.
+
+        Parameters
+        ----------
+        cards: list[:class:`CardSpec`]
+            The cards of the drop.
+        cards_per_row: :class:`int`
+            How many cards to align per row.
+
+        Returns
+        -------
+        :class:`PIL.Image.Image`
+            The collage.
+        """
+        layout = cls.get_layout(cards, cards_per_row)
+        canvas = layout.new_canvas()
+        for index, card in enumerate(cards):
+            cls.render_slot(canvas, layout, index, card)
+
+        return canvas
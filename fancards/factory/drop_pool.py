@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from .card import CardFactory, CardSpec
+from .encoder import ImageEncoder
+from .renderer import RendererBusy
+from fancards.enums import Weight
+
+
+if TYPE_CHECKING:
+    from .renderer import CardRenderer
+
+__all__ = (
+    "ReadyDrop",
+    "DropPool"
+)
+
+log = logging.getLogger(__name__)
+
+# how long the producer waits before trying again while the renderer is busy with live jobs
+BUSY_BACKOFF = 0.5
+DROP_CARD_AMOUNT = 3
+
+
+@dataclass(frozen=True)
+class ReadyDrop:
+    """A drawn, rendered and encoded drop that is ready to be sent."""
+    weight: Weight
+    cards: list[CardSpec]
+    image: bytes
+    encoder: ImageEncoder
+
+
+class DropPool:
+    """Keeps a small queue of ready drops per :class:`Weight`, refilled in the background.
+
+    Parameters
+    ----------
+    renderer: :class:`CardRenderer`
+        The renderer the drops are rendered on.
+    size: :class:`int`
+        The amount of ready drops kept per weight.
+    max_bytes: :class:`int`
+        The producer stops refilling once the encoded drops in the queues take up this many bytes.
+    cpu_budget: :class:`float`
+        The fraction of time, between ``0`` and ``1``, the producer may spend rendering.
+        After every drop it sleeps long enough to stay within that fraction.
+    encoder: :class:`ImageEncoder`
+        How the drops are encoded.
+
+    Attributes
+    ----------
+    nbytes: :class:`int`
+        The total size of the encoded drops in the queues.
+    hits: :class:`int`
+        How many drops were taken from a queue.
+    misses: :class:`int`
+        How many drops had to be rendered on demand because their queue was empty.
+    """
+    def __init__(
+        self,
+        renderer: CardRenderer,
+        *,
+        size: int = 4,
+        max_bytes: int = 16 * 1024 * 1024,
+        cpu_budget: float = 0.25,
+        encoder: ImageEncoder = ImageEncoder.WEBP
+    ):
+        if not 0 < cpu_budget <= 1:
+            raise ValueError("cpu_budget must be greater than 0 and at most 1.")
+
+        self.renderer = renderer
+        self.size = size
+        self.max_bytes = max_bytes
+        self.cpu_budget = cpu_budget
+        self.encoder = encoder
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._queues: dict[Weight, deque[ReadyDrop]] = {weight: deque() for weight in Weight}
+        self._refill = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def depth(self) -> dict[Weight, int]:
+        """The amount of ready drops per weight."""
+        return {weight: len(queue) for weight, queue in self._queues.items()}
+
+    def start(self) -> None:
+        """Starts refilling the queues in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._produce())
+
+    def stop(self) -> None:
+        """Stops refilling the queues. Ready drops stay in the queues."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def get(self, weight: Weight) -> ReadyDrop:
+        """Takes a ready drop of ``weight``, rendering one on demand if there is none.
+
+        Parameters
+        ----------
+        weight: :class:`Weight`
+            The weight type the cards of the drop are drawn with.
+
+        Returns
+        -------
+        :class:`ReadyDrop`
+            The drop.
+        """
+        queue = self._queues[weight]
+        if queue:
+            drop = queue.popleft()
+            self.nbytes -= len(drop.image)
+            self.hits += 1
+        else:
+            self.misses += 1
+            drop = await self.create_drop(weight)
+
+        self._refill.set()
+        return drop
+
+    async def create_drop(self, weight: Weight) -> ReadyDrop:
+        """Draws and renders a new drop of ``weight`` without touching the queues.
+
+        The cards get placeholder IDs, the collage does not show them. Real card IDs are
+        only allocated once the drop is sent, see :meth:`CardIdAllocator.assign`.
+        """
+        cards = CardFactory.draw_cards(amount=DROP_CARD_AMOUNT, weight=weight)
+        image = await self.renderer.render_drop(cards, encoder=self.encoder)
+        return ReadyDrop(weight=weight, cards=cards, image=image, encoder=self.encoder)
+
+    def _get_next_weight(self) -> Optional[Weight]:
+        """Returns the weight with the emptiest queue, ``None`` if every queue is full or the memory cap is reached."""
+        if self.nbytes >= self.max_bytes:
+            return None
+
+        weight = min(self._queues, key=lambda weight: len(self._queues[weight]))
+        return weight if len(self._queues[weight]) < self.size else None
+
+    async def _produce(self) -> None:
+        while True:
+            weight = self._get_next_weight()
+            if weight is None:
+                self._refill.clear()
+                await self._refill.wait()
+                continue
+
+            if self.renderer.pending:  # live drops and cards go first
+                await asyncio.sleep(BUSY_BACKOFF)
+                continue
+
+            start = time.perf_counter()
+            try:
+                drop = await self.create_drop(weight)
+            except RendererBusy:  # live jobs filled the queue in the meantime
+                await asyncio.sleep(BUSY_BACKOFF)
+                continue
+            except Exception:
+                log.exception("Failed to pre-render a drop of weight %s.", weight.name)
+                await asyncio.sleep(BUSY_BACKOFF)
+                continue
+
+            self._queues[weight].append(drop)
+            self.nbytes += len(drop.image)
+
+            elapsed = time.perf_counter() - start
+            await asyncio.sleep(elapsed * (1 - self.cpu_budget) / self.cpu_budget)
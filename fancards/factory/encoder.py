@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from io import BytesIO
+from enum import Enum
+from typing import Any
+from dataclasses import dataclass, field
+
+from PIL import Image
+
+
+__all__ = (
+    "ImageEncoder",
+    "encode_image"
+)
+
+
+@dataclass(frozen=True)
+class ImageEncoderData:
+    format: str
+    options: dict[str, Any] = field(default_factory=dict)
+    palette: bool = False
+
+
+class ImageEncoder(Enum):
+    """Represents a way to encode an image, trading file size for encoding time or quality."""
+    PNG = ImageEncoderData(format="png")
+    PNG_FAST = ImageEncoderData(
+        format="png",
+        options={"compress_level": 1}
+    )
+    PNG_PALETTE = ImageEncoderData(
+        format="png",
+        palette=True
+    )
+    WEBP_LOSSLESS = ImageEncoderData(
+        format="webp",
+        options={"lossless": True, "quality": 0, "method": 0}
+    )
+    WEBP = ImageEncoderData(
+        format="webp",
+        options={"quality": 80, "method": 2}
+    )
+
+    @property
+    def extension(self) -> str:
+        return self.value.format
+
+    def encode(self, image: Image.Image) -> bytes:
+        """Encodes ``image`` into the bytes of an image file.
+        
+        Parameters
+        ----------
+        image: :class:`PIL.Image.Image`
+            The image to encode.
+        
+        Returns
+        -------
+        :class:`bytes`
+            The encoded image.
+        """
+        if self.value.palette:
+            image = image.quantize(256, method=Image.Quantize.FASTOCTREE)
+
+        buffer = BytesIO()
+        image.save(buffer, format=self.value.format, **self.value.options)
+        return buffer.getvalue()
+
+
+def encode_image(image: Image.Image, encoder: ImageEncoder = ImageEncoder.PNG) -> bytes:
+    """Encodes ``image`` with ``encoder``. A shorthand for :meth:`ImageEncoder.encode`."""
+    return encoder.encode(image)
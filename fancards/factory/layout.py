@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from PIL import Image, ImageDraw
+
+from .assets import Assets
+from fancards.enums import CardRarity, Character
+
+
+__all__ = (
+    "CharacterNameLayout",
+    "CharacterNameLayouts"
+)
+
+NAME_BOUND_WIDTH = 285
+NAME_BOUND_HEIGHT = 50
+NAME_MAX_FONT_SIZE = 49
+
+
+@dataclass(frozen=True)
+class CharacterNameLayout:
+    font_size: int
+    bbox: tuple[int, int, int, int]
+    position: tuple[float, float]
+
+
+def _fit_font(character_name: str) -> tuple[int, tuple[int, int, int, int]]:
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))  # only used for measuring
+    font_size = NAME_MAX_FONT_SIZE
+    bbox = draw.multiline_textbbox((0, 0), character_name, font=Assets.get_font(font_size))
+
+    while bbox[2] > NAME_BOUND_WIDTH:
+        font_size -= 1
+        bbox = draw.multiline_textbbox((0, 0), character_name, font=Assets.get_font(font_size))
+
+    return font_size, bbox
+
+
+def _compute_layout(font_size: int, bbox: tuple[int, int, int, int], card_width: int) -> CharacterNameLayout:
+    width, height = bbox[2:]
+    x = (card_width - width) / 2
+    y = (900 - height) / 2 + 5
+
+    if height > NAME_BOUND_HEIGHT:
+        y -= 5
+
+    return CharacterNameLayout(
+        font_size=font_size,
+        bbox=bbox,
+        position=(x, y)
+    )
+
+
+class CharacterNameLayouts:
+    """A table of the font size, bounding box and position of every character name.
+
+    The table is keyed by the display name and the card width, so renaming a character
+    or changing a template is picked up on the next :meth:`load`.
+    """
+    _layouts: dict[tuple[str, int], CharacterNameLayout] = {}
+
+    @classmethod
+    def load(cls) -> None:
+        """Computes the layout of every character for every card template width."""
+        card_widths = {Assets.get_card_size(rarity)[0] for rarity in CardRarity}
+        layouts: dict[tuple[str, int], CharacterNameLayout] = {}
+        for character in Character.get_all_characters():
+            font_size, bbox = _fit_font(character.display_name)
+            for card_width in card_widths:
+                layouts[(character.display_name, card_width)] = _compute_layout(font_size, bbox, card_width)
+
+        cls._layouts = layouts
+
+    @classmethod
+    def get(cls, character_name: str, card_width: int) -> CharacterNameLayout:
+        """Returns the layout of ``character_name`` on a card that is ``card_width`` pixels wide.
+        
+        Parameters
+        ----------
+        character_name: :class:`str`
+            The text to lay out.
+        card_width: :class:`int`
+            The width of the card the text is drawn on.
+        
+        Returns
+        -------
+        :class:`CharacterNameLayout`
+            The layout, computed on demand if it is not in the table.
+        """
+        key = (character_name, card_width)
+        if key not in cls._layouts:
+            cls._layouts[key] = _compute_layout(*_fit_font(character_name), card_width)
+
+        return cls._layouts[key]
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import os
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import TypeVar, Callable, Literal, Optional, Any
+
+from .assets import Assets
+from .card import CardFactory, CardSpec
+from .disk_cache import DiskRenderCache
+from .drop import DropCollage
+from .encoder import ImageEncoder, encode_image
+from .layout import CharacterNameLayouts
+
+
+__all__ = (
+    "CardRenderer",
+    "RendererBusy"
+)
+
+T = TypeVar("T")
+ExecutorType = Literal["thread", "process"]
+
+
+def _init_worker() -> None:
+    Assets.load()
+    CharacterNameLayouts.load()
+
+
+def _render_card(spec: CardSpec, encoder: ImageEncoder, scale: float, use_render_cache: bool) -> bytes:
+    card_image = CardFactory.render_card(spec, scale) if use_render_cache else CardFactory.reveal_card(spec, scale)
+    return encode_image(card_image, encoder)
+
+
+def _reveal_card(spec: CardSpec, encoder: ImageEncoder) -> bytes:
+    return encode_image(CardFactory.reveal_card(spec), encoder)
+
+
+def _render_drop(cards: list[CardSpec], encoder: ImageEncoder) -> bytes:
+    return encode_image(DropCollage.render(cards), encoder)
+
+
+class RendererBusy(Exception):
+    """Raised when a job is submitted while the queue of the :class:`CardRenderer` is full."""
+    pass
+
+
+class CardRenderer:
+    """Runs card rendering and encoding on a pool so that it does not block the event loop.
+
+    At most ``max_workers`` jobs run on the pool at once and at most ``queue_size`` more
+    wait for a free worker. Jobs past that are rejected with :class:`RendererBusy`
+    instead of piling up, so callers can shed work while the renderer is overloaded.
+
+    Workers of a process pool have their own in-memory caches, which the bot cannot reach.
+    In process mode stored cards therefore skip the in-memory render cache, so that
+    :meth:`invalidate_cards` never leaves stale renders behind, and only the card
+    independent base layers are cached per worker. The disk cache is always read and
+    written from the bot's process, so its statistics stay accurate in both modes.
+
+    Parameters
+    ----------
+    executor: Literal["thread", "process"]
+        Whether to render on a thread pool or a process pool.
+    max_workers: Optional[:class:`int`]
+        The amount of workers in the pool. Defaults to the amount of CPUs.
+    queue_size: :class:`int`
+        The maximum amount of jobs waiting for a free worker.
+    disk_cache: Optional[:class:`DiskRenderCache`]
+        Where encoded cards are looked up before and stored after rendering them.
+
+    Attributes
+    ----------
+    pending: :class:`int`
+        The amount of jobs that are waiting for or running on the pool.
+    rejected: :class:`int`
+        How many jobs were rejected because the queue was full.
+    """
+    def __init__(
+        self,
+        *,
+        executor: ExecutorType = "thread",
+        max_workers: Optional[int] = None,
+        queue_size: int = 32,
+        disk_cache: Optional[DiskRenderCache] = None
+    ):
+        self.executor_type = executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.disk_cache = disk_cache
+        self.pending = 0
+        self.rejected = 0
+        self._executor = self._create_executor()
+        self._workers = asyncio.Semaphore(self.max_workers)
+
+    def _create_executor(self) -> Executor:
+        if self.executor_type == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="card_renderer")
+
+    @property
+    def is_full(self) -> bool:
+        """Whether every worker is busy and the queue is full, so the next job would be rejected."""
+        return self.pending >= self.max_workers + self.queue_size
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs ``func`` on the pool and waits for its result.
+
+        ``func`` and its arguments have to be picklable if the renderer uses a process pool.
+
+        Raises
+        ------
+        RendererBusy
+            Every worker is busy and the queue is full.
+        """
+        if self.is_full:
+            self.rejected += 1
+            raise RendererBusy(f"The renderer is busy with {self.pending} jobs.")
+
+        self.pending += 1
+        try:
+            async with self._workers:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        finally:
+            self.pending -= 1
+
+    async def render(self, spec: CardSpec, *, encoder: ImageEncoder = ImageEncoder.PNG, scale: float = 1.0) -> bytes:
+        """Renders and encodes a stored card.
+        
+        Parameters
+        ----------
+        spec: :class:`CardSpec`
+            The properties of the card.
+        encoder: :class:`ImageEncoder`
+            How to encode the card.
+        scale: :class:`float`
+            The size of the card relative to the full card, e.g. :data:`THUMBNAIL_SCALE` for thumbnails.
+        
+        Raises
+        ------
+        RendererBusy
+            Every worker is busy and the queue is full.
+
+        Returns
+        -------
+        :class:`bytes`
+            The encoded card, ready for :func:`fancards.utils.bytes_to_discord_file`.
+        """
+        if self.disk_cache is not None:
+            data = await asyncio.to_thread(self.disk_cache.get, spec, encoder, scale)
+            if data is not None:
+                return data
+
+        data = await self.run(_render_card, spec, encoder, scale, self.executor_type == "thread")
+        if self.disk_cache is not None:
+            await asyncio.to_thread(self.disk_cache.set, spec, encoder, data, scale)
+
+        return data
+
+    async def render_many(
+        self,
+        specs: list[CardSpec],
+        *,
+        encoder: ImageEncoder = ImageEncoder.PNG,
+        scale: float = 1.0
+    ) -> list[bytes]:
+        """Renders and encodes multiple stored cards concurrently, in the order of ``specs``."""
+        return await asyncio.gather(*[self.render(spec, encoder=encoder, scale=scale) for spec in specs])
+
+    async def reveal(self, spec: CardSpec, *, encoder: ImageEncoder = ImageEncoder.PNG) -> bytes:
+        """Reveals and encodes a dropped card on top of its cached base layer.
+
+        Unlike :meth:`render` this skips the render caches, since most dropped cards are
+        never grabbed and their reveals are not worth keeping around.
+
+        Parameters
+        ----------
+        spec: :class:`CardSpec`
+            The properties of the card.
+        encoder: :class:`ImageEncoder`
+            How to encode the card.
+
+        Returns
+        -------
+        :class:`bytes`
+            The encoded card, ready for :func:`fancards.utils.bytes_to_discord_file`.
+        """
+        return await self.run(_reveal_card, spec, encoder)
+
+    async def render_drop(self, cards: list[CardSpec], *, encoder: ImageEncoder = ImageEncoder.PNG) -> bytes:
+        """Renders and encodes the collage of unrevealed drop ``cards``.
+
+        The whole collage is composited and encoded in a single job, so a drop costs one
+        round-trip to the pool and its canvas is never shared between workers.
+
+        Parameters
+        ----------
+        cards: list[:class:`CardSpec`]
+            The cards of the drop, in the order they are shown.
+        encoder: :class:`ImageEncoder`
+            How to encode the collage.
+
+        Returns
+        -------
+        :class:`bytes`
+            The encoded collage, ready for :func:`fancards.utils.bytes_to_discord_file`.
+        """
+        return await self.run(_render_drop, cards, encoder)
+
+    def invalidate_cards(self, card_ids: list[str]) -> None:
+        """Removes every cached render of the cards with ``card_ids``, e.g. after their condition changed or they got burned.
+
+        Only a thread pool caches renders of stored cards in memory, see :class:`CardRenderer`.
+        """
+        if self.executor_type == "thread":
+            CardFactory.invalidate_cards(card_ids)
+
+    def close(self) -> None:
+        """Shuts the pool down without waiting for running jobs."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
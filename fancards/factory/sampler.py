@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Optional
+
+from fancards.enums import Weight, CardRarity, CardCondition
+
+
+__all__ = ("DropSampler",)
+
+SHINY_WEIGHTS = {
+    Weight.NEW_USER: -1,  # no shiny for new users
+    Weight.NORMAL: 0.05,
+    Weight.PREMIUM: 0.2
+}
+
+
+def _random_number(rng: Optional[random.Random]) -> float:
+    return (rng or random).random() * 100
+
+
+@dataclass(frozen=True)
+class DropSampler:
+    """The precomputed thresholds to draw rarities, conditions and shiny states of one :class:`Weight`.
+
+    Every draw takes a random number ``r`` between 0 and 100 like before:
+
+    - the rarity is the rarest one whose weight is at least ``r``, otherwise the most common rarity.
+    - the condition is a random one of every condition whose weight is at least ``r``, otherwise ``GOOD``.
+    - the card is shiny if ``r`` is at most the shiny weight.
+
+    Which rarity or set of conditions applies only changes at the weights themselves,
+    so they are stored per interval between two sorted weights and looked up with a bisection.
+    Given the same random numbers, the draws are exactly the same as iterating over the enums.
+
+    Attributes
+    ----------
+    weight: :class:`Weight`
+        The weight type the thresholds are built from.
+    rarity_bounds: tuple[:class:`float`, ...]
+        The ascending upper bounds of the intervals of ``rarities``.
+    rarities: tuple[:class:`CardRarity`, ...]
+        The rarity drawn in each interval.
+    default_rarity: :class:`CardRarity`
+        The rarity drawn above the last bound.
+    condition_bounds: tuple[:class:`float`, ...]
+        The ascending upper bounds of the intervals of ``conditions``.
+    conditions: tuple[tuple[:class:`CardCondition`, ...], ...]
+        The conditions a random one is chosen from in each interval.
+    shiny_weight: :class:`float`
+        The shiny weight without the patreon bonus.
+    """
+    weight: Weight
+    rarity_bounds: tuple[float, ...]
+    rarities: tuple[CardRarity, ...]
+    default_rarity: CardRarity
+    condition_bounds: tuple[float, ...]
+    conditions: tuple[tuple[CardCondition, ...], ...]
+    shiny_weight: float
+
+    @classmethod
+    def get(cls, weight: Optional[Weight] = None) -> DropSampler:
+        """Gets the sampler of ``weight``. Defaults to ``Weight.NORMAL`` if ``None``."""
+        return _samplers[weight or Weight.NORMAL]
+
+    @classmethod
+    def create(cls, weight: Weight) -> DropSampler:
+        """Builds the thresholds of ``weight`` from the weights of every rarity and condition."""
+        weight_name = weight.name.lower()
+        rarity_weights = [
+            (rarity, getattr(rarity.weight, weight_name))  # similar to rarity.weight.normal
+            for rarity in CardRarity.get_non_exclusive_rarities() if rarity.weight is not None
+        ]
+
+        # walking from the rarest rarity, each one wins every number above the weights of all rarer ones
+        rarity_bounds: list[float] = []
+        rarities: list[CardRarity] = []
+        for rarity, rarity_weight in sorted(rarity_weights, key=lambda item: item[0].index, reverse=True):
+            if rarity_weight is not None and (not rarity_bounds or rarity_weight > rarity_bounds[-1]):
+                rarity_bounds.append(rarity_weight)
+                rarities.append(rarity)
+
+        default_rarity = max(rarity_weights, key=lambda item: item[1] or -1)[0]
+
+        condition_weights = [
+            (condition, getattr(condition.weight, weight_name))  # similar to condition.weight.new_user
+            for condition in CardCondition
+        ]
+        condition_bounds = sorted({condition_weight for _, condition_weight in condition_weights if condition_weight is not None})
+        conditions = [
+            tuple(
+                condition for condition, condition_weight in condition_weights
+                if condition_weight is not None and condition_weight >= bound
+            )
+            for bound in condition_bounds
+        ]
+
+        return cls(
+            weight=weight,
+            rarity_bounds=tuple(rarity_bounds),
+            rarities=tuple(rarities),
+            default_rarity=default_rarity,
+            condition_bounds=tuple(condition_bounds),
+            conditions=tuple(conditions),
+            shiny_weight=SHINY_WEIGHTS[weight]
+        )
+
+    def get_rarity_chances(self) -> dict[CardRarity, float]:
+        """Returns the exact chance in percent of drawing every rarity.
+
+        Unlike the weights these add up to 100, since only the rarest qualifying rarity is drawn.
+        """
+        chances = dict.fromkeys(self.rarities, 0.0)
+        lower_bound = 0.0
+        for bound, rarity in zip(self.rarity_bounds, self.rarities):
+            chances[rarity] += max(min(bound, 100) - lower_bound, 0)
+            lower_bound = max(lower_bound, min(bound, 100))
+
+        chances[self.default_rarity] = chances.get(self.default_rarity, 0.0) + 100 - lower_bound
+        return chances
+
+    def get_condition_chances(self) -> dict[CardCondition, float]:
+        """Returns the exact chance in percent of drawing every condition."""
+        chances = dict.fromkeys(CardCondition, 0.0)
+        lower_bound = 0.0
+        for bound, conditions in zip(self.condition_bounds, self.conditions):
+            interval = max(min(bound, 100) - lower_bound, 0)
+            for condition in conditions:
+                chances[condition] += interval / len(conditions)
+
+            lower_bound = max(lower_bound, min(bound, 100))
+
+        chances[CardCondition.GOOD] += 100 - lower_bound
+        return chances
+
+    def get_shiny_chance(self, patreon: bool = False) -> float:
+        """Returns the exact chance in percent of drawing a shiny card."""
+        return min(max(self.get_shiny_weight(patreon), 0), 100)
+
+    def get_shiny_weight(self, patreon: bool = False) -> float:
+        """Returns the shiny weight, doubled if ``patreon`` is ``True``."""
+        return self.shiny_weight * 2 if patreon else self.shiny_weight
+
+    def draw_rarity(self, rng: Optional[random.Random] = None) -> CardRarity:
+        """Draws a rarity, using the global random generator if ``rng`` is ``None``."""
+        index = bisect_left(self.rarity_bounds, _random_number(rng))
+        return self.rarities[index] if index < len(self.rarities) else self.default_rarity
+
+    def draw_condition(self, rng: Optional[random.Random] = None) -> CardCondition:
+        """Draws a condition, using the global random generator if ``rng`` is ``None``."""
+        index = bisect_left(self.condition_bounds, _random_number(rng))
+        if index < len(self.conditions):
+            return (rng or random).choice(self.conditions[index])
+
+        return CardCondition.GOOD  # 'GOOD' if the random number is too high
+
+    def draw_shiny(self, patreon: bool = False, rng: Optional[random.Random] = None) -> bool:
+        """Draws a shiny state, using the global random generator if ``rng`` is ``None``."""
+        return _random_number(rng) <= self.get_shiny_weight(patreon)
+
+
+_samplers = {weight: DropSampler.create(weight) for weight in Weight}
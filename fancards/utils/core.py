@@ -6,11 +6,13 @@ from discord import File
 from PIL import Image
 
 from .. import enums
+from ..factory.encoder import ImageEncoder
 
 
 __all__ = (
     "create_progress_bar",
     "save_image_to_discord_file",
+    "bytes_to_discord_file",
     "parse_arguments",
     "get_card_property_text"
 )
@@ -44,7 +46,7 @@ def save_image_to_discord_file(
     image: Image.Image,
     *,
     filename: str = "unknown_image",
-    format: str = "png"
+    encoder: ImageEncoder = ImageEncoder.PNG
 ) -> tuple[str, File]:
     """Converts a :class:`PIL.Image.Image` and saves it into a :class:`discord.File`.
     
@@ -54,22 +56,43 @@ def save_image_to_discord_file(
         The image to save.
     filename: :class:`str`
         The name of the file.
-    format: :class:`str`
-        The file extension to use.
+    encoder: :class:`ImageEncoder`
+        How to encode the image, which also decides the file extension.
     
     Returns
     -------
     tuple[:class:`str`, :class:`discord.File`]
         The url "attachment://unknown_image.png" for :meth:`discord.Embed.set_image(url=)` and the saved image file.
     """
-    buffer = BytesIO()
-    image.save(buffer, format=format)
-    buffer.seek(0)
+    return bytes_to_discord_file(encoder.encode(image), filename=filename, encoder=encoder)
 
-    full_filename = f"{filename}.{format}"
+
+def bytes_to_discord_file(
+    data: bytes,
+    *,
+    filename: str = "unknown_image",
+    encoder: ImageEncoder = ImageEncoder.PNG
+) -> tuple[str, File]:
+    """Wraps already encoded image bytes into a :class:`discord.File`.
+    
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The encoded image.
+    filename: :class:`str`
+        The name of the file.
+    encoder: :class:`ImageEncoder`
+        The encoder ``data`` was encoded with, which decides the file extension.
+    
+    Returns
+    -------
+    tuple[:class:`str`, :class:`discord.File`]
+        The url "attachment://unknown_image.png" for :meth:`discord.Embed.set_image(url=)` and the file.
+    """
+    full_filename = f"{filename}.{encoder.extension}"
     url = f"attachment://{full_filename}"
 
-    return (url, File(buffer, filename=full_filename))
+    return (url, File(BytesIO(data), filename=full_filename))
 
 
 def parse_arguments(table: dict[str, Any], string: str) -> str:
@@ -85,9 +85,10 @@ class EmbedPaginator(discord.ui.View):
         interaction: discord.Interaction,
         *,
         embeds: list[discord.Embed],
-        footer: Optional[str] = None
+        footer: Optional[str] = None,
+        timeout: Optional[float] = 180
     ):
-        super().__init__(timeout=None)
+        super().__init__(timeout=timeout)
         self.current_page = 0
         self.max_pages = len(embeds)
         self.interaction = interaction
@@ -199,6 +200,14 @@ class EmbedPaginator(discord.ui.View):
         embed = self.embeds[self.current_page]
         embed.set_footer(text=self.get_footer())
         await interaction.response.edit_message(embed=embed, view=None)
+        self.stop()
+
+    async def on_timeout(self) -> None:
+        # remove the buttons so the view and its embeds are not kept alive after the timeout
+        try:
+            await self.interaction.edit_original_response(view=None)
+        except discord.HTTPException:
+            pass
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if self.author != interaction.user:
@@ -209,8 +218,8 @@ class EmbedPaginator(discord.ui.View):
 
 
 class EmbedPaginatorConfirm(EmbedPaginator):
-    def __init__(self, interaction: discord.Interaction, embeds: list[discord.Embed]):
-        super().__init__(interaction, embeds=embeds)
+    def __init__(self, interaction: discord.Interaction, embeds: list[discord.Embed], timeout: Optional[float] = 180):
+        super().__init__(interaction, embeds=embeds, timeout=timeout)
         self.value = None
         self.remove_item(self.quit_button)
 
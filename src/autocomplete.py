@@ -61,5 +61,9 @@ async def card_id_autocomplete(interaction: discord.Interaction, current: str) -
 
 
 async def character_name_autocomplete(interaction: discord.Interaction, current: str) -> Choices:
-    character_names = [character.display_name for character in Character.get_all_characters()]
-    return await autocomplete_close_matches(interaction, current, character_names)
+    catalog = Character.get_catalog()
+    close_matches = catalog.search(current) or catalog.characters
+    return [
+        app_commands.Choice(name=character.display_name, value=character.display_name)
+        for character in close_matches[:OPTION_LIMIT]
+    ]
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import sys
 import random
+import asyncio
+import weakref
 import datetime
+import dataclasses
 from collections import Counter
-from typing import TYPE_CHECKING, Optional, Literal, Any
+from typing import TYPE_CHECKING, ClassVar, Optional, Literal, Any
 
 import discord
 from discord import app_commands
@@ -13,14 +17,23 @@ from src.autocomplete import (
     card_rarity_autocomplete,
     card_condition_autocomplete,
     card_id_autocomplete,
-    character_name_autocomplete,
-    regex_autocomplete
+    character_name_autocomplete
 )
 from fancards import utils, enums
 from fancards.custom_discord.app_commands import Group
 from fancards.database import Player, CardTable
-from fancards.enums.patreon import is_patreon
-from fancards.factory import CardFactory, CardImage, CARD_ID_LENGTH
+from fancards.enums.patreon import is_patreon, patreon_tier_cache
+from fancards.factory import (
+    CardFactory,
+    CardRenderer,
+    CardSpec,
+    DropSampler,
+    ImageEncoder,
+    ReadyDrop,
+    RendererBusy,
+    CARD_ID_LENGTH,
+    THUMBNAIL_SCALE
+)
 
 
 if TYPE_CHECKING:
@@ -28,6 +41,10 @@ if TYPE_CHECKING:
 
 BUTTON_COOLDOWN_CACHE = utils.from_cooldown(1, 6)
 
+# how images are encoded depending on where they are displayed, drops are encoded by the drop pool (see config.ini)
+VIEW_IMAGE_ENCODER = ImageEncoder.WEBP_LOSSLESS
+THUMBNAIL_IMAGE_ENCODER = ImageEncoder.WEBP
+
 
 async def _confirm_card_burn_single(
     interaction: discord.Interaction,
@@ -59,6 +76,7 @@ async def _confirm_card_burn_single(
         await player.inventory.add_item(enums.Item.GLISTENING_GEM, glistening_gems)
 
     await player.collection.delete_card(card.card_id)
+    bot.renderer.invalidate_cards([card.card_id])
     embed = utils.create_interaction_embed(
         interaction,
         description=success_text,
@@ -115,6 +133,8 @@ async def _confirm_card_burn_all(
         return None
     
     await player.collection.delete_cards_by_card_id(valid_card_ids)
+    bot: Fancards = interaction.client  # type: ignore
+    bot.renderer.invalidate_cards(valid_card_ids)
     
     await player.balance.add_silver(total_silver)
     await player.balance.add_star(total_star)
@@ -131,6 +151,7 @@ async def _confirm_card_burn_all(
 
 
 async def _handle_card_burn_single(interaction: discord.Interaction, card: CardTable) -> None:
+    bot: Fancards = interaction.client  # type: ignore
     card_id = card.card_id
     card_rarity = card.rarity
     card_condition = card.condition
@@ -138,14 +159,8 @@ async def _handle_card_burn_single(interaction: discord.Interaction, card: CardT
     card_is_shiny = card.is_shiny
     card_created_at = card.created_at
     
-    card_image = CardFactory.generate_card(
-        card_id=card_id,
-        rarity=card_rarity,
-        condition=card_condition,
-        character_name=card_character_name,
-        shiny=card_is_shiny
-    ).image
-    card_image_url, card_image_file = utils.save_image_to_discord_file(card_image, filename="card")
+    card_image = await bot.renderer.render(_get_card_spec(card), encoder=THUMBNAIL_IMAGE_ENCODER, scale=THUMBNAIL_SCALE)
+    card_image_url, card_image_file = utils.bytes_to_discord_file(card_image, filename="card", encoder=THUMBNAIL_IMAGE_ENCODER)
     card_property_text = utils.get_card_property_text(
         card_id=card_id,
         rarity=card_rarity,
@@ -520,6 +535,16 @@ async def _paginate_card_collection(
     await interaction.followup.send(embed=embed, view=paginator)
 
 
+def _get_card_spec(card: CardTable) -> CardSpec:
+    return CardSpec(
+        card_id=card.card_id,
+        rarity=card.rarity,
+        condition=card.condition,
+        character_name=card.character_name,
+        is_shiny=card.is_shiny
+    )
+
+
 def _calculate_bonus_days(value: int, card_created_at: datetime.datetime) -> int:
     days = (discord.utils.utcnow() - card_created_at).days
     days = min(days, 60)
@@ -571,9 +596,9 @@ def _filter_card_collection(
             filtered_cards = cards
 
     if character_name is not None:
-        character_names = [character.display_name for character in enums.Character.get_all_characters()]
-        character_name = regex_autocomplete(character_name, character_names)[0]
-        filtered_cards = [card for card in filtered_cards if card.character_name == character_name and card.character_name in character_names]
+        catalog = enums.Character.get_catalog()
+        character = catalog.find(character_name) or next(iter(catalog.search(character_name)), None)
+        filtered_cards = [card for card in filtered_cards if character is not None and card.character_name == character.display_name]
 
     if card_age is not None:
         card_age_delta = utils.str_to_timedelta(card_age)
@@ -602,6 +627,18 @@ def _filter_card_collection(
     return filtered_cards
 
 
+async def _send_renderer_busy(interaction: discord.Interaction) -> None:
+    embed = utils.create_interaction_embed(
+        interaction,
+        description="The card printer is overloaded right now, please try again in a moment.",
+        level="error"
+    )
+    if interaction.response.is_done():
+        await interaction.followup.send(embed=embed, ephemeral=True)
+    else:
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
 def _get_troll_text() -> str:
     troll_texts = [
         "Did you really just grab me?",
@@ -670,10 +707,15 @@ def _get_card_condition_text(condition: enums.CardCondition) -> str:
     return random.choice(mapping[condition])
 
 
+def _retrieve_reveal_exception(task: asyncio.Task[bytes]) -> None:
+    # reveals that failed and were never grabbed would otherwise log that their exception was never retrieved
+    if not task.cancelled():
+        task.exception()
+
+
 class _DropViewButton(discord.ui.Button[discord.ui.View]):
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(style=discord.ButtonStyle.gray, *args, **kwargs)
-        self.grabbed_card_indexes: list[int] = []
 
     async def callback(self, interaction: discord.Interaction):
         if not isinstance(self.view, _DropView):
@@ -685,13 +727,9 @@ class _DropViewButton(discord.ui.Button[discord.ui.View]):
         user_is_patreon = is_patreon(user)
         drop_owner = self.view.author
 
-        player = Player(bot.pool, user.id)
-        fk_user_id = await player.register()
-
-        cards = await player.collection.get_cards()
-        card_count = len(cards) if not cards else 0
-        backpack_capacity = await player.get_backpack_capacity()
-        if backpack_capacity is not None and card_count >= backpack_capacity:
+        context = await Player(bot.pool, user.id).get_context()
+        player = context.player
+        if context.is_backpack_full:
             embed = utils.create_interaction_embed(
                 interaction,
                 description="Your backpack is full! Consider burning cards or upgrading your backpack.",
@@ -702,7 +740,7 @@ class _DropViewButton(discord.ui.Button[discord.ui.View]):
         
         assert self.custom_id
         selected_button_index = int(self.custom_id.partition(":")[-1])  # get the index of the button that was pressed
-        if selected_button_index in self.grabbed_card_indexes:
+        if selected_button_index in self.view.grabbed_card_indexes:
             utils.reset_cooldown(interaction, BUTTON_COOLDOWN_CACHE)
             embed = utils.create_interaction_embed(
                 interaction,
@@ -712,32 +750,42 @@ class _DropViewButton(discord.ui.Button[discord.ui.View]):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return None
         
-        self.grabbed_card_indexes.append(selected_button_index)
+        self.view.grabbed_card_indexes.add(selected_button_index)
         self.disabled = True
         await interaction.response.edit_message(view=self.view)
 
-        card: CardImage = self.view.cards[selected_button_index]
+        card: CardSpec = self.view.cards[selected_button_index]
         card_rarity = card.rarity
         card_condition = card.condition
-        card_character = card.character
+        card_character = enums.Character.get_character_data(card.character_name)
         card_id = card.card_id
         weight = self.view.weight
 
-        # overwrite the previously generated card to check if the user that interacted with the button is a patreon
-        # and to show the condition and ID of the card.
-        card = CardFactory.generate_card(
-            rarity=card_rarity,
-            condition=card_condition,
-            character_name=card_character.display_name,
-            card_id=card_id,
-            shiny=user_is_patreon
-        )
-
-        card_image = card.image
-        card_is_shiny = card.is_shiny
-        card_rarity_weight: enums.WeightData = getattr(card_rarity.weight, weight.name.lower())
-        card_condition_weight: enums.WeightData = getattr(card_condition.weight, weight.name.lower())
-        card_image_url, card_image_file = utils.save_image_to_discord_file(card_image, filename="card")
+        # reroll the shiny state to check if the user that interacted with the button is a patreon
+        # and reveal the condition and ID of the card. Non-shiny reveals are already being rendered
+        # in the background, shiny ones are rare enough to be rendered on demand.
+        card_is_shiny = user_is_patreon or CardFactory.get_shiny()
+        try:
+            if card_is_shiny:
+                card_image = await bot.renderer.reveal(
+                    dataclasses.replace(card, is_shiny=True),
+                    encoder=VIEW_IMAGE_ENCODER
+                )
+            else:
+                card_image = await self.view.get_reveal(bot.renderer, selected_button_index)
+        except RendererBusy:
+            # nothing was stored yet, so the card can be grabbed again once the renderer caught up
+            self.view.grabbed_card_indexes.discard(selected_button_index)
+            self.disabled = False
+            if not self.view.is_finished():
+                await interaction.edit_original_response(view=self.view)
+            raise
+
+        # the actual chances, the weights themselves overlap since only the rarest qualifying rarity is drawn
+        sampler = DropSampler.get(weight)
+        card_rarity_chance = round(sampler.get_rarity_chances()[card_rarity], 2)
+        card_condition_chance = round(sampler.get_condition_chances()[card_condition], 2)
+        card_image_url, card_image_file = utils.bytes_to_discord_file(card_image, filename="card", encoder=VIEW_IMAGE_ENCODER)
 
         if card_character.display_name == "Troll":
             troll_text = _get_troll_text()
@@ -746,11 +794,10 @@ class _DropViewButton(discord.ui.Button[discord.ui.View]):
             await interaction.followup.send(embed=embed, file=card_image_file)
             return None
 
-        assert fk_user_id
         await player.collection.add_card(
             CardTable(
                 card_id=card_id,
-                fk_user_id=fk_user_id,
+                fk_user_id=context.fk_user_id,
                 rarity=card_rarity,
                 condition=card_condition,
                 character_name=card_character.display_name,
@@ -778,8 +825,8 @@ class _DropViewButton(discord.ui.Button[discord.ui.View]):
             description = f"{user.mention} {verb} {rarity_text} card **`{card_id}`**!\n{condition_text}\n\n{rewards_text}"
 
         if card_is_shiny:
-            shiny_weight = CardFactory.get_shiny_weight(weight, user_is_patreon)
-            shiny_text = f"\nShiny ({shiny_weight}%)"
+            shiny_chance = sampler.get_shiny_chance(user_is_patreon)
+            shiny_text = f"\nShiny ({shiny_chance:g}%)"
         else:
             shiny_text = ""
 
@@ -787,23 +834,69 @@ class _DropViewButton(discord.ui.Button[discord.ui.View]):
             interaction,
             description=description,
             color=card_rarity.color,
-            footer=f"Rarity: {card_rarity.display_name.title()} ({card_rarity_weight}%)\nCondition: {card_condition.display_name.title()} ({card_condition_weight}%){shiny_text}"
+            footer=f"Rarity: {card_rarity.display_name.title()} ({card_rarity_chance:g}%)\nCondition: {card_condition.display_name.title()} ({card_condition_chance:g}%){shiny_text}"
         )
         embed.set_image(url=card_image_url)
         await interaction.followup.send(embed=embed, file=card_image_file)
             
 
 class _DropView(discord.ui.View):
-    def __init__(self, author: discord.Member, weight: enums.Weight):
+    # every drop that can still be grabbed, for the live drop memory gauge
+    live: ClassVar[weakref.WeakSet[_DropView]] = weakref.WeakSet()
+
+    def __init__(self, author: discord.Member, drop: ReadyDrop):
         super().__init__(timeout=10)
         self.author = author
-        self.weight = weight
-        self.cards = CardFactory.generate_cards(
-            weight=weight,
-            show_card_id=False,
-            show_card_condition=False
-        )
+        self.drop = drop
+        self.weight = drop.weight
+        self.cards = drop.cards
+        self.reveals: dict[int, asyncio.Task[bytes]] = {}
+        self.grabbed_card_indexes: set[int] = set()
         self._init_buttons()
+        self.live.add(self)
+
+    @property
+    def nbytes(self) -> int:
+        """The approximate memory held by the drop; its card specs, encoded collage and finished reveals."""
+        nbytes = len(self.drop.image) + sum(sys.getsizeof(card) for card in self.cards)
+        for task in self.reveals.values():
+            if task.done() and not task.cancelled() and task.exception() is None:
+                nbytes += len(task.result())
+
+        return nbytes
+
+    @classmethod
+    def get_live_nbytes(cls) -> int:
+        """Gauges the memory held by every live drop."""
+        return sum(view.nbytes for view in cls.live)
+
+    def start_reveals(self, renderer: CardRenderer) -> None:
+        """Starts rendering the non-shiny reveal of every card in the background so grabs do not have to wait for it."""
+        for idx, card in enumerate(self.cards):
+            spec = dataclasses.replace(card, is_shiny=False)
+            task = asyncio.create_task(renderer.reveal(spec, encoder=VIEW_IMAGE_ENCODER))
+            task.add_done_callback(_retrieve_reveal_exception)
+            self.reveals[idx] = task
+
+    async def get_reveal(self, renderer: CardRenderer, idx: int) -> bytes:
+        """Waits for the non-shiny reveal of the card at ``idx``, rendering it now if it was not started or was rejected."""
+        task = self.reveals.pop(idx, None)
+        if task is not None:
+            try:
+                return await task
+            except RendererBusy:
+                pass
+
+        spec = dataclasses.replace(self.cards[idx], is_shiny=False)
+        return await renderer.reveal(spec, encoder=VIEW_IMAGE_ENCODER)
+
+    def cancel_reveals(self) -> None:
+        """Cancels every reveal that has not been grabbed, e.g. after the drop expired."""
+        for task in self.reveals.values():
+            task.cancel()
+
+        self.reveals.clear()
+        self.live.discard(self)
 
     def _init_buttons(self) -> None:
         for idx, card in enumerate(self.cards):
@@ -829,6 +922,8 @@ class _DropView(discord.ui.View):
                 level="error"
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
+        elif isinstance(error, RendererBusy):
+            await _send_renderer_busy(interaction)
         else:
             await super().on_error(interaction, error, item)
 
@@ -838,6 +933,40 @@ class CardCog(commands.Cog):
         self.bot = bot
         self.log = bot.log
 
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
+        if isinstance(error, app_commands.CommandInvokeError) and isinstance(error.original, RendererBusy):
+            await _send_renderer_busy(interaction)
+        else:
+            await super().cog_app_command_error(interaction, error)
+
+    @commands.is_owner()
+    @commands.command(name="stats")
+    async def stats(self, ctx: commands.Context[Fancards]) -> None:
+        """Shows how the renderer, the caches, the drop pool and the card IDs are doing"""
+        renderer = self.bot.renderer
+        drop_pool = self.bot.drop_pool
+        render_cache = CardFactory.render_cache
+        depth = ", ".join(f"{weight.name.lower()} {amount}" for weight, amount in drop_pool.depth.items())
+        usage = await self.bot.card_id_allocator.get_usage()
+
+        lines = [
+            f"renderer: {renderer.pending} pending, {renderer.rejected} rejected",
+            f"render cache: {len(render_cache)} cards, {render_cache.nbytes / 1024 / 1024:.1f} MiB, {render_cache.hit_rate:.0%} hits",
+        ]
+        if renderer.disk_cache is not None:
+            disk_cache = renderer.disk_cache
+            lines.append(
+                f"disk cache: {disk_cache.nbytes / 1024 / 1024:.1f} MiB, {disk_cache.hits} hits, {disk_cache.misses} misses"
+            )
+
+        lines += [
+            f"drop pool: {depth} ready, {drop_pool.nbytes / 1024 / 1024:.1f} MiB, {drop_pool.hits} hits, {drop_pool.misses} misses",
+            f"live drops: {len(_DropView.live)}, {_DropView.get_live_nbytes() / 1024 / 1024:.1f} MiB",
+            f"card ids: {usage.allocated_percent:.4f}% allocated, {usage.stored_percent:.4f}% stored, {self.bot.card_id_allocator.remaining} in memory",
+            f"patreon tiers: {len(patreon_tier_cache)} members, {patreon_tier_cache.hit_rate:.0%} hits"
+        ]
+        await ctx.send("```\n" + "\n".join(lines) + "\n```")
+
     card_command_group = Group(name="card")
 
     @card_command_group.cooldown(1, 15)
@@ -862,10 +991,11 @@ class CardCog(commands.Cog):
             weight = enums.Weight.PREMIUM
             text_premium_drop = f"Used {enums.Item.PREMIUM_DROP.display()} `x1`, you now have `x{item_quantity}` remaining.\n\n"
 
-        view = _DropView(user, weight)
-        cards = view.cards
-        dropped_cards_image = CardFactory.align_card_images([card.image for card in cards])
-        image_url, image_file = utils.save_image_to_discord_file(dropped_cards_image, filename="dropped_cards")
+        # card IDs are only allocated now, so drops that are never sent do not use any up
+        drop = await self.bot.drop_pool.get(weight)
+        cards = await self.bot.card_id_allocator.assign(drop.cards)
+        view = _DropView(user, dataclasses.replace(drop, cards=cards))
+        image_url, image_file = utils.bytes_to_discord_file(drop.image, filename="dropped_cards", encoder=drop.encoder)
 
         rarest_card = max(cards, key=lambda c: c.rarity.index)
         card_count = len(view.cards)
@@ -876,9 +1006,13 @@ class CardCog(commands.Cog):
             color=rarest_card.rarity.color
         )
         embed.set_image(url=image_url)
-        message = await interaction.followup.send(embed=embed, file=image_file, view=view, wait=True)
+        try:
+            message = await interaction.followup.send(embed=embed, file=image_file, view=view, wait=True)
+            view.start_reveals(self.bot.renderer)
+            timeout = await view.wait()
+        finally:
+            view.cancel_reveals()
 
-        timeout = await view.wait()
         if timeout:
             embed = utils.create_interaction_embed(
                 interaction,
@@ -1019,14 +1153,8 @@ class CardCog(commands.Cog):
         card_character_name = card.character_name
         card_is_shiny = card.is_shiny
 
-        card_image = CardFactory.generate_card(
-            card_id=card_id,
-            rarity=card_rarity,
-            condition=card_condition,
-            character_name=card_character_name,
-            shiny=card_is_shiny
-        ).image
-        card_image_url, card_image_file = utils.save_image_to_discord_file(card_image, filename="card_preview")
+        card_image = await self.bot.renderer.render(_get_card_spec(card), encoder=VIEW_IMAGE_ENCODER)
+        card_image_url, card_image_file = utils.bytes_to_discord_file(card_image, filename="card_preview", encoder=VIEW_IMAGE_ENCODER)
 
         embed = utils.create_interaction_embed(
             interaction,